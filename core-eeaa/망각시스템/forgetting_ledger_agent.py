@@ -11,15 +11,24 @@
 import os
 import json
 import time
-import hashlib
 import random
+import secrets
+import itertools
+import struct
+# hashlib.sha256 는 OpenSSL EVP 구현으로, 런타임에 SHA-NI / ARMv8 SHA2 명령을 자동 선택한다.
+from hashlib import sha256 as _sha256
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 으로 저장
+    orjson = None
+
 class ForgettingStage(Enum):
     """9단계 망각 단계 정의"""
     ORIGINAL = 0
@@ -42,7 +51,61 @@ class Reversibility(Enum):
     DISTRIBUTED_KEY_DEPENDENT = "distributed_key_dependent"
     IRREVERSIBLE = "irreversible"
 
-@dataclass
+# 제네시스 블록의 부모 해시
+_GENESIS_PREV_HASH = "0000" + "0" * 60
+
+# 단계별 (압축률 하한, 압축률 상한, 보존율 하한, 보존율 상한, 가역성)
+# 4단계 압축률은 마스킹 비율로 덮어쓰며, 9단계는 구간 폭 0으로 상수 취급
+_STAGE_PARAMS: Tuple[Tuple[float, float, float, float, Reversibility], ...] = (
+    (0.20, 0.30, 0.95, 0.98, Reversibility.FULLY_REVERSIBLE),           # 1: 메타데이터 압축
+    (0.60, 0.80, 0.90, 0.95, Reversibility.FULLY_REVERSIBLE),           # 2: 인덱스 압축
+    (0.65, 0.75, 0.85, 0.90, Reversibility.FULLY_REVERSIBLE),           # 3: 참조 압축
+    (0.00, 0.00, 0.75, 0.80, Reversibility.CONDITIONALLY_REVERSIBLE),   # 4: 4차원 마스킹
+    (0.85, 0.95, 0.65, 0.70, Reversibility.CONDITIONALLY_REVERSIBLE),   # 5: 구조적 압축
+    (0.85, 0.95, 0.50, 0.65, Reversibility.LIMITED_REVERSIBLE),         # 6: 핵심정보 추출
+    (0.90, 0.95, 0.30, 0.45, Reversibility.KEY_DEPENDENT),              # 7: 암호화 저장
+    (0.95, 0.98, 0.20, 0.30, Reversibility.DISTRIBUTED_KEY_DEPENDENT),  # 8: 키 분산 저장
+    (1.00, 1.00, 0.00, 0.00, Reversibility.IRREVERSIBLE),               # 9: 키 파기 (Crypto Shredding)
+)
+_STAGE_REVERSIBILITY = tuple(p[4] for p in _STAGE_PARAMS)
+
+# 4차원 마스킹 축 비트 (x=1, y=2, z=4, t=8)
+_DIM_ORDER = ('x', 'y', 'z', 't')
+_DIM_BIT = {dim: 1 << i for i, dim in enumerate(_DIM_ORDER)}
+
+def _dimension_mask(dimensions: List[str]) -> int:
+    """마스킹 축 목록 → 비트마스크 (알 수 없는 축은 무시)"""
+    mask = 0
+    for dim in dimensions:
+        mask |= _DIM_BIT.get(dim, 0)
+    return mask
+
+# 종합 테스트에서 검증하는 15개 축 조합: (키, 축 목록, 비트마스크)
+_MASKING_TEST_COMBINATIONS = tuple(
+    (''.join(combo), combo, _dimension_mask(combo))
+    for combo in (
+        ('x',), ('y',), ('z',), ('t',),
+        ('x', 'y'), ('x', 'z'), ('x', 't'),
+        ('y', 'z'), ('y', 't'), ('z', 't'),
+        ('x', 'y', 'z'), ('x', 'y', 't'),
+        ('x', 'z', 't'), ('y', 'z', 't'),
+        ('x', 'y', 'z', 't'),
+    )
+)
+
+def _merkle_root(tx_ids: List[bytes]) -> bytes:
+    """트랜잭션 ID 목록의 머클 루트 (SHA-256, 홀수 레벨은 마지막 노드 복제)
+
+    트랜잭션이 하나면 루트는 해당 tx_id 의 SHA-256 과 같다.
+    """
+    level = [_sha256(tx_id).digest() for tx_id in tx_ids] or [_sha256(b"").digest()]
+    while len(level) > 1:
+        if len(level) & 1:
+            level.append(level[-1])
+        level = [_sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0]
+
+@dataclass(slots=True, frozen=True)
 class BlockTransaction:
     """블록체인 트랜잭션 구조"""
     tx_id: str
@@ -51,7 +114,7 @@ class BlockTransaction:
     data: Dict[str, Any]
     signature: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ForgetBlock:
     """망각 블록 구조"""
     block_index: int
@@ -68,10 +131,19 @@ class ForgetBlock:
 class ForgettingLedgerAgent:
     """망각/원장 에이전트 메인 클래스"""
     
+    # 단계 1~9 압축률/보존율 난수 구간 (SoA)
+    _COMPRESSION_LOW = np.array([p[0] for p in _STAGE_PARAMS])
+    _COMPRESSION_HIGH = np.array([p[1] for p in _STAGE_PARAMS])
+    _PRESERVATION_LOW = np.array([p[2] for p in _STAGE_PARAMS])
+    _PRESERVATION_HIGH = np.array([p[3] for p in _STAGE_PARAMS])
+    
     def __init__(self, config_path: Optional[str] = None):
         self.config = self._load_config(config_path)
         self.blockchain: List[ForgetBlock] = []
-        self.current_keys: Dict[str, str] = {}
+        self._block_dicts: List[Dict[str, Any]] = []  # blockchain 직렬화 캐시
+        self._last_hash = _GENESIS_PREV_HASH  # 체인 끝 블록 해시
+        self._height = 0
+        self.current_keys: Dict[str, bytes] = {}  # data_id → 32바이트 데이터 키
         self.stage_thresholds = {
             1: 0.95, 2: 0.90, 3: 0.85,
             4: 0.75, 5: 0.65, 6: 0.50
@@ -82,6 +154,12 @@ class ForgettingLedgerAgent:
             'z': 0.33,   # 행
             't': 0.66    # 열
         }
+        # masking_dimensions 값 튜플 → 마스킹 비율 테이블 (_mask_table 에서 지연 생성)
+        self._mask_lut_key: Optional[Tuple[float, ...]] = None
+        self._mask_lut: Tuple[float, ...] = ()
+        self._rng = np.random.default_rng()
+        self._nonce_counter = itertools.count()
+        self._validator_counter = itertools.count()
         
     def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
         """설정 로드"""
@@ -100,21 +178,67 @@ class ForgettingLedgerAgent:
                 
         return default_config
     
-    def calculate_hash(self, data: str) -> str:
-        """SHA-256 해시 계산"""
-        return hashlib.sha256(data.encode()).hexdigest()
+    def calculate_hash(self, data: Union[str, bytes]) -> str:
+        """SHA-256 해시 계산 (bytes 입력은 인코딩 없이 그대로 사용)"""
+        return _sha256(data if isinstance(data, bytes) else data.encode()).hexdigest()
+    
+    def calculate_digest(self, data: bytes) -> bytes:
+        """SHA-256 원시 다이제스트 (32바이트)"""
+        return _sha256(data).digest()
     
+    def _next_nonce(self) -> int:
+        """6자리 블록 nonce (단조 증가 카운터)"""
+        return 100000 + next(self._nonce_counter) % 900000
+    
+    def _next_validator(self) -> str:
+        """합의 노드 라운드로빈 선택"""
+        return f"consensus_node_{next(self._validator_counter) % self.config['consensus_nodes'] + 1}"
+    
+    def _append_block(self, block: ForgetBlock) -> None:
+        """블록을 체인에 추가하고 직렬화 결과를 누적"""
+        self.blockchain.append(block)
+        self._block_dicts.append(asdict(block))
+        self._last_hash = block.block_hash
+        self._height += 1
+    
+    def _seal_block(self, block: ForgetBlock) -> ForgetBlock:
+        """머클 루트 및 블록 해시 계산 (모든 블록 생성 경로의 단일 해시 지점)
+
+        각 블록의 프리이미지가 직전 블록 해시를 포함하므로 체인 내 블록 해시는
+        본질적으로 순차적이다.
+        """
+        merkle_digest = _merkle_root([tx.tx_id.encode() for tx in block.transactions])
+        block.merkle_root = merkle_digest.hex()
+        # 고정 길이 이진 프리이미지: 인덱스(u64 LE) | 타임스탬프 | 이전 해시(32B) | 머클 루트(32B)
+        # hex 문자열 필드는 직렬화 경계에서만 사용한다.
+        block_data = b"".join([
+            struct.pack("<Q", block.block_index),
+            block.timestamp.encode("ascii"),
+            bytes.fromhex(block.previous_block_hash),
+            merkle_digest,
+        ])
+        # 앞 30바이트 → 60자리 hex (hexdigest()[:60] 과 동일)
+        block.block_hash = "0000" + self.calculate_digest(block_data)[:30].hex()
+        return block
+    
+    def _build_mask_lut(self) -> Tuple[float, ...]:
+        """16개 축 조합 전체의 마스킹 비율 테이블: 1 - Π(1 - r_i)"""
+        dim_vals = np.array([self.masking_dimensions.get(dim, 0.0) for dim in _DIM_ORDER])
+        bits = (np.arange(1 << len(_DIM_ORDER))[:, None] >> np.arange(len(_DIM_ORDER))) & 1
+        keep = np.where(bits == 1, 1.0 - dim_vals, 1.0)
+        return tuple((1.0 - np.prod(keep, axis=1)).tolist())
+    
+    def _mask_table(self) -> Tuple[float, ...]:
+        """현재 masking_dimensions 값에 대한 마스킹 비율 테이블 (값이 바뀌면 재생성)"""
+        key = tuple(self.masking_dimensions.get(dim, 0.0) for dim in _DIM_ORDER)
+        if key != self._mask_lut_key:
+            self._mask_lut = self._build_mask_lut()
+            self._mask_lut_key = key
+        return self._mask_lut
+
     def calculate_4d_masking_ratio(self, dimensions: List[str]) -> float:
         """4차원 마스킹 비율 계산"""
-        if not dimensions:
-            return 0.0
-            
-        combined_ratio = 1.0
-        for dim in dimensions:
-            if dim in self.masking_dimensions:
-                combined_ratio *= (1 - self.masking_dimensions[dim])
-        
-        return 1 - combined_ratio
+        return self._mask_table()[_dimension_mask(dimensions)]
     
     def verify_stage_threshold(self, stage: int, preservation_rate: float) -> Tuple[bool, str]:
         """단계별 보존율 임계값 검증"""
@@ -138,67 +262,43 @@ class ForgettingLedgerAgent:
             "reversibility_status": Reversibility.FULLY_REVERSIBLE.value
         }
         
-        original_size = random.uniform(10, 50) * 1024 * 1024  # 10-50MB
+        original_size = self._rng.uniform(10, 50) * 1024 * 1024  # 10-50MB
         current_size = original_size
         
-        for stage in range(1, min(target_stage + 1, 10)):
-            stage_start = time.time()
+        # 전 단계 난수를 한 번에 추출
+        num_stages = max(0, min(target_stage, 9))
+        compressions = self._rng.uniform(
+            self._COMPRESSION_LOW[:num_stages], self._COMPRESSION_HIGH[:num_stages]
+        ).tolist()
+        preservations = self._rng.uniform(
+            self._PRESERVATION_LOW[:num_stages], self._PRESERVATION_HIGH[:num_stages]
+        ).tolist()
+        
+        total_ns = 0
+        for stage in range(1, num_stages + 1):
+            stage_start_ns = time.perf_counter_ns()
             
-            # 단계별 압축 시뮬레이션
-            if stage == 1:  # 메타데이터 압축
-                compression = random.uniform(0.2, 0.3)
-                preservation = random.uniform(0.95, 0.98)
-                reversibility = Reversibility.FULLY_REVERSIBLE
-                
-            elif stage == 2:  # 인덱스 압축
-                compression = random.uniform(0.6, 0.8)
-                preservation = random.uniform(0.90, 0.95)
-                reversibility = Reversibility.FULLY_REVERSIBLE
-                
-            elif stage == 3:  # 참조 압축
-                compression = random.uniform(0.65, 0.75)
-                preservation = random.uniform(0.85, 0.90)
-                reversibility = Reversibility.FULLY_REVERSIBLE
-                
-            elif stage == 4:  # 4차원 마스킹
-                dimensions = ['x', 'y', 'z']
-                masking_ratio = self.calculate_4d_masking_ratio(dimensions)
+            # 단계별 압축 시뮬레이션 (테이블 조회 후 부수효과가 있는 단계만 분기)
+            compression = compressions[stage - 1]
+            preservation = preservations[stage - 1]
+            reversibility = _STAGE_REVERSIBILITY[stage - 1]
+            
+            if stage == 4:  # 4차원 마스킹
+                masking_ratio = self.calculate_4d_masking_ratio(['x', 'y', 'z'])
                 compression = masking_ratio * 0.8
-                preservation = random.uniform(0.75, 0.80)
-                reversibility = Reversibility.CONDITIONALLY_REVERSIBLE
                 
-            elif stage == 5:  # 구조적 압축
-                compression = random.uniform(0.85, 0.95)
-                preservation = random.uniform(0.65, 0.70)
-                reversibility = Reversibility.CONDITIONALLY_REVERSIBLE
-                
-            elif stage == 6:  # 핵심정보 추출
-                compression = random.uniform(0.85, 0.95)
-                preservation = random.uniform(0.50, 0.65)
-                reversibility = Reversibility.LIMITED_REVERSIBLE
-
             elif stage == 7:  # 암호화 저장
                 if data_id not in self.current_keys:
-                    self.current_keys[data_id] = hashlib.sha256(f"{data_id}-{time.time()}".encode()).hexdigest()
-                compression = random.uniform(0.90, 0.95)
-                preservation = random.uniform(0.30, 0.45)
-                reversibility = Reversibility.KEY_DEPENDENT
-
+                    self.current_keys[data_id] = secrets.token_bytes(32)
+                    
             elif stage == 8:  # 키 분산 저장
                 if data_id in self.current_keys:
                     del self.current_keys[data_id]  # 키 분산 완료
-                compression = random.uniform(0.95, 0.98)
-                preservation = random.uniform(0.20, 0.30)
-                reversibility = Reversibility.DISTRIBUTED_KEY_DEPENDENT
-
-            elif stage == 9:  # 키 파기 (Crypto Shredding)
-                compression = 1.0
-                preservation = 0.0
-                reversibility = Reversibility.IRREVERSIBLE
             
             current_size *= (1 - compression)
-            stage_end = time.time()
-            processing_time = stage_end - stage_start
+            stage_ns = time.perf_counter_ns() - stage_start_ns
+            total_ns += stage_ns
+            processing_time = stage_ns * 1e-9
             
             # 임계값 검증
             threshold_pass, threshold_msg = self.verify_stage_threshold(stage, preservation)
@@ -215,13 +315,13 @@ class ForgettingLedgerAgent:
             }
             
             results["stages_completed"].append(stage_result)
-            results["total_processing_time"] += processing_time
             results["reversibility_status"] = reversibility.value
             
             if not threshold_pass:
                 results["error"] = f"Stage {stage} failed threshold check"
                 break
         
+        results["total_processing_time"] = total_ns * 1e-9
         results["final_compression_ratio"] = current_size / original_size
         return results
     
@@ -243,23 +343,19 @@ class ForgettingLedgerAgent:
         )
         
         block = ForgetBlock(
-            block_index=len(self.blockchain) + 1,
+            block_index=self._height + 1,
             timestamp=timestamp,
-            previous_block_hash="0000" + "0" * 60 if not self.blockchain else self.blockchain[-1].block_hash,
-            merkle_root=self.calculate_hash(tx_id),
-            nonce=random.randint(100000, 999999),
+            previous_block_hash=self._last_hash,
+            merkle_root="",
+            nonce=self._next_nonce(),
             difficulty=self.config["blockchain_difficulty"],
             transactions=[transaction],
-            validator=f"consensus_node_{random.randint(1, 5)}",
+            validator=self._next_validator(),
             block_signature="",
             block_hash=""
         )
         
-        # 블록 해시 계산
-        block_data = f"{block.block_index}{block.timestamp}{block.previous_block_hash}{block.merkle_root}"
-        block.block_hash = "0000" + self.calculate_hash(block_data)[:60]
-        
-        return block
+        return self._seal_block(block)
     
     def create_forgetting_completion_block(self, request_tx_id: str, processing_results: Dict[str, Any]) -> ForgetBlock:
         """망각 완료 블록 생성"""
@@ -273,23 +369,19 @@ class ForgettingLedgerAgent:
         )
         
         block = ForgetBlock(
-            block_index=len(self.blockchain) + 1,
+            block_index=self._height + 1,
             timestamp=timestamp,
-            previous_block_hash=self.blockchain[-1].block_hash if self.blockchain else "0000" + "0" * 60,
-            merkle_root=self.calculate_hash(transaction.tx_id),
-            nonce=random.randint(100000, 999999),
+            previous_block_hash=self._last_hash,
+            merkle_root="",
+            nonce=self._next_nonce(),
             difficulty=self.config["blockchain_difficulty"],
             transactions=[transaction],
-            validator=f"consensus_node_{random.randint(1, 5)}",
+            validator=self._next_validator(),
             block_signature="",
             block_hash=""
         )
         
-        # 블록 해시 계산
-        block_data = f"{block.block_index}{block.timestamp}{block.previous_block_hash}{block.merkle_root}"
-        block.block_hash = "0000" + self.calculate_hash(block_data)[:60]
-        
-        return block
+        return self._seal_block(block)
     
     def test_recovery_before_stage_9(self, data_id: str, current_stage: int) -> Dict[str, Any]:
         """9단계 이전 복원 테스트"""
@@ -300,24 +392,31 @@ class ForgettingLedgerAgent:
             "overall_success": True
         }
         
-        for stage in range(current_stage + 1):
+        # 단계별 복원율/소요시간 난수를 한 번에 추출
+        num_tests = max(0, current_stage + 1)
+        u_rate = self._rng.random(num_tests).tolist()
+        u_time = self._rng.random(num_tests).tolist()
+        
+        for stage in range(num_tests):
             if stage <= 3:  # 완전 가역
                 success = True
                 recovery_rate = 1.0
                 method = "direct_reconstruction"
-                time_required = random.uniform(0.001, 1.0)
+                time_lo, time_hi = 0.001, 1.0
                 
             elif stage <= 6:  # 조건부/제한적 가역
                 success = True
-                recovery_rate = random.uniform(0.6, 0.95)
+                recovery_rate = 0.6 + (0.95 - 0.6) * u_rate[stage]
                 method = "pattern_based_reconstruction"
-                time_required = random.uniform(1.0, 60.0)
+                time_lo, time_hi = 1.0, 60.0
                 
             else:  # 키 의존적 (7-8단계)
                 success = True
-                recovery_rate = 1.0 if random.random() > 0.1 else 0.0  # 90% 성공률
+                recovery_rate = 1.0 if u_rate[stage] > 0.1 else 0.0  # 90% 성공률
                 method = "key_based_decryption"
-                time_required = random.uniform(60.0, 7200.0)
+                time_lo, time_hi = 60.0, 7200.0
+            
+            time_required = time_lo + (time_hi - time_lo) * u_time[stage]
             
             test_result = {
                 "stage": stage,
@@ -375,7 +474,7 @@ class ForgettingLedgerAgent:
         # 1. 망각 요청 블록 생성
         print("1️⃣ 망각 요청 블록 생성...")
         request_block = self.create_forgetting_request_block(data_id, 6)
-        self.blockchain.append(request_block)
+        self._append_block(request_block)
         print(f"   요청 블록 생성 완료: {request_block.block_hash[:16]}...")
         
         # 2. 망각 프로세스 실행
@@ -389,7 +488,7 @@ class ForgettingLedgerAgent:
             request_block.transactions[0].tx_id,
             processing_results
         )
-        self.blockchain.append(completion_block)
+        self._append_block(completion_block)
         print(f"   완료 블록 생성: {completion_block.block_hash[:16]}...")
         
         # 4. 9단계 이전 복원 테스트
@@ -400,23 +499,15 @@ class ForgettingLedgerAgent:
         
         # 5. 4차원 마스킹 테스트
         print("5️⃣ 4차원 마스킹 비율 검증...")
-        masking_tests = {}
-        test_combinations = [
-            ['x'], ['y'], ['z'], ['t'],
-            ['x', 'y'], ['x', 'z'], ['x', 't'],
-            ['y', 'z'], ['y', 't'], ['z', 't'],
-            ['x', 'y', 'z'], ['x', 'y', 't'],
-            ['x', 'z', 't'], ['y', 'z', 't'],
-            ['x', 'y', 'z', 't']
-        ]
-        
-        for combo in test_combinations:
-            ratio = self.calculate_4d_masking_ratio(combo)
-            masking_tests[''.join(combo)] = {
-                "dimensions": combo,
-                "masking_ratio": ratio,
+        mask_lut = self._mask_table()
+        masking_tests = {
+            key: {
+                "dimensions": list(combo),
+                "masking_ratio": mask_lut[mask],
                 "security_score": len(combo) * 2.5 if len(combo) <= 3 else 10
             }
+            for key, combo, mask in _MASKING_TEST_COMBINATIONS
+        }
         
         print(f"   마스킹 조합 테스트 완료: {len(masking_tests)}개 조합")
         
@@ -437,7 +528,7 @@ class ForgettingLedgerAgent:
                 "post_9_irreversibility_confirmed": post_9_recovery["irreversibility_confirmed"],
                 "masking_combinations_tested": len(masking_tests)
             },
-            "blockchain": [asdict(block) for block in self.blockchain],
+            "blockchain": list(self._block_dicts),
             "processing_results": processing_results,
             "pre_9_recovery": pre_9_recovery,
             "post_9_recovery": post_9_recovery,
@@ -446,8 +537,12 @@ class ForgettingLedgerAgent:
     
     def save_test_results(self, results: Dict[str, Any], output_file: str):
         """테스트 결과 저장"""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, separators=(',', ':'))
         print(f"📄 테스트 결과 저장: {output_file}")
 
 def main():
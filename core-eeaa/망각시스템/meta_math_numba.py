@@ -0,0 +1,59 @@
+"""
+Numba-compiled kernels for the meta-mathematical verification framework
+
+Fused single-pass versions of the Σ I·ΔL log-odds sum and the D-separation
+independence scan. Importing this module requires numba; meta_math_verification
+falls back to its NumPy implementations when it is not available.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def log_odds_kernel(confidence, strength, weights, ln_base):
+    """Σ I·ΔL over parallel confidence / strength / type-weight arrays"""
+    total = 0.0
+    for i in range(confidence.shape[0]):
+        info_content = -np.log2(1.0 - confidence[i] + 1e-10)
+        log_likelihood = np.log(strength[i] / (1.0 - strength[i] + 1e-10)) / ln_base
+        total += info_content * log_likelihood * weights[i]
+    return total
+
+
+@njit(cache=True)
+def dsep_kernel(type_idx, source_idx, confidence, strength):
+    """Independence score per item: exp(-mean pairwise mutual information)"""
+    n = type_idx.shape[0]
+    scores = np.ones(n)
+    if n < 2:
+        return scores
+    mi_sum = np.zeros(n)
+    for i in range(n):
+        for j in range(i + 1, n):
+            shared = 0.0
+            if type_idx[i] == type_idx[j]:
+                shared += 1.0
+            if source_idx[i] == source_idx[j]:
+                shared += 1.0
+            if abs(confidence[i] - confidence[j]) < 0.1:
+                shared += 1.0
+            if abs(strength[i] - strength[j]) < 0.1:
+                shared += 1.0
+            mi = -np.log(1.0 - shared / 10.0 + 1e-10)
+            mi_sum[i] += mi
+            mi_sum[j] += mi
+    for i in range(n):
+        scores[i] = np.exp(-mi_sum[i] / (n - 1))
+    return scores
+
+
+def _warm_up():
+    """Trigger compilation (or cache load) for the float64/int64 signatures"""
+    conf = np.array([0.9, 0.95])
+    strength = np.array([0.8, 0.85])
+    log_odds_kernel(conf, strength, np.array([1.0, 0.9]), 1.0)
+    dsep_kernel(np.array([0, 1], dtype=np.int64), np.array([0, 0], dtype=np.int64), conf, strength)
+
+
+_warm_up()
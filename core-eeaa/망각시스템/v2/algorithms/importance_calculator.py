@@ -1,6 +1,6 @@
 """Importance calculator with weighted aggregation."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 
 def _norm(value: float) -> float:
@@ -8,6 +8,9 @@ def _norm(value: float) -> float:
 
 
 class ImportanceCalculator:
+    # Meta key carrying a score filled in upstream (earlier stage or cache)
+    score_key = "_importance_score"
+
     def __init__(self, weights: Optional[Dict[str, float]] = None):
         self.weights = weights or {
             "semantic_value": 0.25,
@@ -17,13 +20,30 @@ class ImportanceCalculator:
             "collab_value": 0.1,
             "creative_potential": 0.1,
         }
+        total_w = sum(self.weights.values())
+        # Normalized (key, weight) pairs, fixed at construction
+        self._kw = tuple((k, w / total_w) for k, w in self.weights.items()) if total_w else ()
+
+    @property
+    def linear_weights(self) -> Tuple[Tuple[str, float], ...]:
+        """Normalized (key, weight) pairs: score = clip(sum of w * meta.get(key, 0.5))."""
+        return self._kw
 
     def compute(self, item: Any, meta: Dict[str, Any]) -> float:
-        score = 0.0
-        total_w = 0.0
-        for k, w in self.weights.items():
-            score += w * float(meta.get(k, 0.5))
-            total_w += w
-        if total_w == 0:
+        pre = meta.get(self.score_key)
+        if pre is not None:
+            return _norm(float(pre))
+        if not self._kw:
             return 0.5
-        return _norm(score / total_w)
+        return _norm(sum(w * float(meta.get(k, 0.5)) for k, w in self._kw))
+
+    def compute_batch(self, items: Sequence[Any], metas: Sequence[Dict[str, Any]]) -> List[float]:
+        """Score a batch column-wise (one pass per weight); matches ``compute`` per item."""
+        if not self._kw:
+            scores = [0.5] * len(metas)
+        else:
+            scores = [0.0] * len(metas)
+            for k, w in self._kw:
+                scores = [s + w * float(m.get(k, 0.5)) for s, m in zip(scores, metas)]
+        key = self.score_key
+        return [_norm(s if (pre := m.get(key)) is None else float(pre)) for s, m in zip(scores, metas)]
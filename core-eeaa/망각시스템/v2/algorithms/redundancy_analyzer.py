@@ -1,45 +1,235 @@
-"""Redundancy analyzer with hash/semantic/entropy cues."""
+"""Redundancy analyzer with token/entropy cues and a MinHash near-duplicate index."""
 
-import re
 import hashlib
 import math
-from typing import Any, Dict
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from v2.utils.summarizer import _tokens, lsh_signature
+from ..utils.content import extract_content
+from ..utils.summarizer import _tokens
 
 
-def _entropy(text: str) -> float:
-    tokens = _tokens(text)
-    if not tokens:
-        return 0.0
-    freq = {}
-    for t in tokens:
-        freq[t] = freq.get(t, 0) + 1
-    total = len(tokens)
-    ent = 0.0
-    for c in freq.values():
-        p = c / total
-        ent -= p * math.log2(p)
+_LOG2 = math.log2
+
+
+def _entropy_from_counts(freq: Counter, total: int) -> float:
+    # H = -sum(p*log2 p) = log2(N) - sum(c*log2 c)/N: no per-term division
+    log2 = _LOG2
+    ent = log2(total) - sum(c * log2(c) for c in freq.values()) / total
     # Normalize by log2(V)
-    norm = ent / math.log2(len(freq) + 1)
+    norm = ent / log2(len(freq) + 1)
     return min(1.0, max(0.0, norm))
 
 
+# Rabin-Karp shingling over the token stream (short documents fall back to single tokens)
+_SHINGLE_K = 32
+_SHINGLE_BASE = 60013
+_SHINGLE_MOD = 10 ** 18 + 3
+
+_MASK64 = (1 << 64) - 1
+_blake2b = hashlib.blake2b
+
+
+@lru_cache(maxsize=65536)
+def _token_hash64(token: str) -> int:
+    # Stable across processes, unlike the per-process salted built-in hash()
+    return int.from_bytes(_blake2b(token.encode(), digest_size=8).digest(), "little")
+
+
+def _shingle_hashes(tokens, k: int = _SHINGLE_K) -> List[int]:
+    """Rolling polynomial hashes of every k-token window."""
+    ids = [_token_hash64(t) & 0x3FFFFFFF for t in tokens]
+    if len(ids) < k:
+        return []
+    base, mod = _SHINGLE_BASE, _SHINGLE_MOD
+    top = pow(base, k - 1, mod)
+    h = 0
+    for x in ids[:k]:
+        h = (h * base + x) % mod
+    out = [h]
+    for i in range(k, len(ids)):
+        h = ((h - ids[i - k] * top) * base + ids[i]) % mod
+        out.append(h)
+    return out
+
+
+# One-permutation MinHash / LSH banding: 64 bins from one hash per token, 16 bands x 4 rows
+_BANDS = 16
+_ROWS = 4
+_BINS = _BANDS * _ROWS
+_BIN_BITS = 6  # log2(_BINS)
+# Added per step when an empty bin borrows a neighbour's minimum (rotation densification);
+# larger than any bin value, so borrowed values never equal real ones
+_BORROW_STEP = 1 << (64 - _BIN_BITS)
+# Odd 64-bit multipliers that fold a band's 4 rows into one word before mixing
+_ROW_MULT = (1, 0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9)
+
+
+def _mix64(h: int) -> int:
+    # splitmix64 finalizer
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return h ^ (h >> 31)
+
+
+def _minhash_bands(unique_tokens) -> Tuple[int, ...]:
+    """One-permutation MinHash of a token set, folded into one 64-bit hash per LSH band.
+
+    Each token is hashed once: the low bits pick a bin and the rest is the
+    value kept at its minimum, so the cost is O(V) rather than O(64 V).
+    """
+    bins: List[Optional[int]] = [None] * _BINS
+    mask = _BINS - 1
+    for h in map(_token_hash64, unique_tokens):
+        b, v = h & mask, h >> _BIN_BITS
+        cur = bins[b]
+        if cur is None or v < cur:
+            bins[b] = v
+    if None in bins:
+        if not any(v is not None for v in bins):
+            return (0,) * _BANDS
+        # Empty bins take the next filled bin's minimum (circularly), offset by the
+        # distance: one backward sweep over two laps finds every bin's successor
+        sig = list(bins)
+        nxt, dist = None, 0
+        for i in range(2 * _BINS - 1, -1, -1):
+            v = bins[i & mask]
+            if v is not None:
+                nxt, dist = v, 0
+            else:
+                dist += 1
+                if nxt is not None and i < _BINS:
+                    sig[i] = nxt + dist * _BORROW_STEP
+    else:
+        sig = bins
+    return tuple(
+        _mix64((band + sig[r] + _ROW_MULT[1] * sig[r + 1] + _ROW_MULT[2] * sig[r + 2]
+                + _ROW_MULT[3] * sig[r + 3]) & _MASK64)
+        for band, r in enumerate(range(0, _BINS, _ROWS))
+    )
+
+
+class _BandBloom:
+    """Aging Bloom filter over band hashes (double hashing).
+
+    Bits and probe count are sized for ``capacity`` insertions at
+    ``fp_rate``. Once ``capacity`` hashes have been added the current filter
+    becomes the previous one and a fresh filter takes over, so lookups see
+    the last ``capacity``..``2 * capacity`` insertions and the false-positive
+    rate stays bounded however long the process runs.
+    """
+
+    __slots__ = ("current", "previous", "mask", "probes", "capacity", "count")
+
+    def __init__(self, capacity: int = 1 << 15, fp_rate: float = 0.01):
+        ln2 = math.log(2)
+        want_bits = max(64, int(-capacity * math.log(fp_rate) / (ln2 * ln2)))
+        size_bits = 1 << (want_bits - 1).bit_length()
+        self.mask = size_bits - 1
+        self.probes = max(1, round(size_bits / capacity * ln2))
+        self.capacity = capacity
+        self.count = 0
+        self.current = bytearray(size_bits >> 3)
+        self.previous: Optional[bytearray] = None
+
+    def check_or_add(self, h: int) -> bool:
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        mask = self.mask
+        positions = [(h1 + i * h2) & mask for i in range(self.probes)]
+        current = self.current
+        if all(current[pos >> 3] & (1 << (pos & 7)) for pos in positions):
+            return True
+        previous = self.previous
+        present = previous is not None and all(previous[pos >> 3] & (1 << (pos & 7)) for pos in positions)
+        for pos in positions:
+            current[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+        if self.count >= self.capacity:
+            self.previous, self.current = current, bytearray(len(current))
+            self.count = 0
+        return present
+
+
+class _RedundancyIndex:
+    """Cross-item near-duplicate index: one Bloom filter per MinHash band.
+
+    The share of bands already seen is the semantic redundancy of a document.
+    Scores of keyed items are remembered with their bands so that re-scoring
+    the same unchanged item does not count it as a duplicate of itself.
+    """
+
+    def __init__(self, bands: int = _BANDS, bloom_capacity: int = 1 << 15, bloom_fp_rate: float = 0.01,
+                 max_keys: int = 65536):
+        self._blooms = [_BandBloom(bloom_capacity, bloom_fp_rate) for _ in range(bands)]
+        self._by_key: "OrderedDict[Any, Tuple[Tuple[int, ...], float]]" = OrderedDict()
+        self._max_keys = max_keys
+        self._lock = threading.Lock()
+
+    def query_or_add(self, key: Any, band_hashes: Tuple[int, ...]) -> float:
+        with self._lock:
+            if key is not None:
+                cached = self._by_key.get(key)
+                # Reuse only while the item's content (its bands) is unchanged
+                if cached is not None and cached[0] == band_hashes:
+                    self._by_key.move_to_end(key)
+                    return cached[1]
+            hits = sum(bloom.check_or_add(h) for bloom, h in zip(self._blooms, band_hashes))
+            score = hits / len(self._blooms)
+            if key is not None:
+                self._by_key[key] = (band_hashes, score)
+                self._by_key.move_to_end(key)
+                if len(self._by_key) > self._max_keys:
+                    self._by_key.popitem(last=False)
+            return score
+
+
+# Content longer than this is scored directly instead of being pinned in the cache
+_CACHE_MAX_CHARS = 4096
+
+
+def _content_features(content: str) -> Optional[Tuple[float, float, Tuple[int, ...]]]:
+    """(token redundancy, entropy, band hashes) for raw content, or None without tokens."""
+    tokens = _tokens(content)
+    if not tokens:
+        return None
+    freq = Counter(tokens)
+    if len(tokens) >= 2 * _SHINGLE_K:
+        # Share of repeated 32-token windows
+        shingles = _shingle_hashes(tokens)
+        uniq_ratio = len(set(shingles)) / len(shingles)
+    else:
+        # Too short for shingles: share of repeated tokens
+        uniq_ratio = len(freq) / len(tokens)
+    token_redundancy = 1.0 - min(1.0, uniq_ratio)
+    ent = _entropy_from_counts(freq, len(tokens))
+    return token_redundancy, ent, _minhash_bands(freq)
+
+
+# Features are a pure function of content; repeated documents hit the cache
+_cached_content_features = lru_cache(maxsize=8192)(_content_features)
+
+
 class RedundancyAnalyzer:
+    def __init__(self):
+        self.index = _RedundancyIndex()
+
     def compute(self, item: Any, meta: Dict[str, Any]) -> float:
         hint = meta.get("redundancy")
-        content = meta.get("content") or item.get("content") if isinstance(item, dict) else None
+        content = extract_content(item, meta)
         if isinstance(content, str):
-            tokens = _tokens(content)
-            if not tokens:
-                return float(hint or 0.0)
-            uniq_ratio = min(1.0, len(set(tokens)) / len(tokens))
-            token_redundancy = 1.0 - uniq_ratio
-            ent = _entropy(content)
-            # Use LSH signature hash length as semantic cue (shorter overlap => higher redundancy)
-            sig = lsh_signature(tokens)
-            sig_hash = hashlib.sha256("".join(sig).encode()).hexdigest()
-            semantic_redundancy = 0.5 if sig_hash else 0.0
-            score = 0.4 * token_redundancy + 0.2 * (1 - ent) + 0.4 * semantic_redundancy
-            return max(0.0, min(1.0, score))
+            if len(content) <= _CACHE_MAX_CHARS:
+                features = _cached_content_features(content)
+            else:
+                features = _content_features(content)
+            if features is not None:
+                token_redundancy, ent, band_hashes = features
+                key = meta.get("id", item.get("id") if isinstance(item, dict) else None)
+                if not isinstance(key, (str, int)):
+                    key = None
+                semantic_redundancy = self.index.query_or_add(key, band_hashes)
+                score = 0.4 * token_redundancy + 0.2 * (1 - ent) + 0.4 * semantic_redundancy
+                return max(0.0, min(1.0, score))
         return float(hint or 0.0)
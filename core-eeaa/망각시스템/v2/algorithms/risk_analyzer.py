@@ -1,6 +1,6 @@
 """Risk analyzer based on multiple factors."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence
 
 
 def _norm(v: float) -> float:
@@ -26,3 +26,6 @@ class RiskAnalyzer:
             + 0.05 * irreversible_penalty
         )
         return _norm(score)
+
+    def compute_batch(self, items: Sequence[Any], metas: Sequence[Dict[str, Any]]) -> List[float]:
+        return [self.compute(item, meta) for item, meta in zip(items, metas)]
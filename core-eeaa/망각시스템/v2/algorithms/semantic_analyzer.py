@@ -1,6 +1,6 @@
 """Semantic analyzer with weighted factors."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence, Tuple
 
 
 def _norm(value: float) -> float:
@@ -16,13 +16,25 @@ class SemanticAnalyzer:
             "innovation_potential": 0.2,
             "educational_value": 0.15,
         }
+        total_w = sum(self.weights.values())
+        # Normalized (key, weight) pairs, fixed at construction
+        self._kw = tuple((k, w / total_w) for k, w in self.weights.items()) if total_w else ()
+
+    @property
+    def linear_weights(self) -> Tuple[Tuple[str, float], ...]:
+        """Normalized (key, weight) pairs: score = clip(sum of w * meta.get(key, 0.5))."""
+        return self._kw
 
     def compute(self, item: Any, meta: Dict[str, Any]) -> float:
-        score = 0.0
-        total_w = 0.0
-        for k, w in self.weights.items():
-            score += w * float(meta.get(k, 0.5))
-            total_w += w
-        if total_w == 0:
+        if not self._kw:
             return 0.5
-        return _norm(score / total_w)
+        return _norm(sum(w * float(meta.get(k, 0.5)) for k, w in self._kw))
+
+    def compute_batch(self, items: Sequence[Any], metas: Sequence[Dict[str, Any]]) -> List[float]:
+        """Score a batch column-wise (one pass per weight); matches ``compute`` per item."""
+        if not self._kw:
+            return [0.5] * len(metas)
+        scores = [0.0] * len(metas)
+        for k, w in self._kw:
+            scores = [s + w * float(m.get(k, 0.5)) for s, m in zip(scores, metas)]
+        return [_norm(s) for s in scores]
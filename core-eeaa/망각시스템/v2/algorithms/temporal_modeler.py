@@ -1,7 +1,7 @@
 """Temporal modeler with half-life and future access adjustment."""
 
 import math
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence
 
 
 class TemporalModeler:
@@ -17,3 +17,20 @@ class TemporalModeler:
         hazard = math.exp(-age_days / max(1.0, self.half_life_days))
         mixed = 0.6 * decay + 0.2 * future_access + 0.2 * hazard
         return max(0.0, min(1.0, mixed))
+
+    def compute_batch(self, items: Sequence[Any], metas: Sequence[Dict[str, Any]]) -> List[float]:
+        """Batch form of ``compute`` with the half-life constants hoisted out of the loop."""
+        half_life = self.half_life_days
+        hazard_scale = max(1.0, half_life)
+        exp = math.exp
+        scores = []
+        for meta in metas:
+            age_days = float(meta.get("age_days", 0.0))
+            if age_days <= 0:
+                scores.append(1.0)
+                continue
+            mixed = (0.6 * 0.5 ** (age_days / half_life)
+                     + 0.2 * float(meta.get("future_access_prob", 0.0))
+                     + 0.2 * exp(-age_days / hazard_scale))
+            scores.append(max(0.0, min(1.0, mixed)))
+        return scores
@@ -1,6 +1,6 @@
 """Usage analyzer with weighted activity features."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence
 
 
 def _norm(value: float) -> float:
@@ -15,16 +15,13 @@ class UsageAnalyzer:
             "recent_access_weight": 0.2,
             "cross_reference_count": 0.1,
         }
+        # (key, default, weight) per feature, fixed at construction
+        defaults = {"access_frequency": 0.0, "cross_reference_count": 0.0}
+        self._features = tuple((k, defaults.get(k, 0.5), w) for k, w in self.weights.items())
 
     def compute(self, item: Any, meta: Dict[str, Any]) -> float:
-        freq = _norm(float(meta.get("access_frequency", 0.0)))
-        success = _norm(float(meta.get("query_success_rate", 0.5)))
-        recent = _norm(float(meta.get("recent_access_weight", 0.5)))
-        cross = _norm(float(meta.get("cross_reference_count", 0.0)))
-        score = (
-            self.weights["access_frequency"] * freq
-            + self.weights["query_success_rate"] * success
-            + self.weights["recent_access_weight"] * recent
-            + self.weights["cross_reference_count"] * cross
-        )
+        score = sum(w * _norm(float(meta.get(k, default))) for k, default, w in self._features)
         return _norm(score)
+
+    def compute_batch(self, items: Sequence[Any], metas: Sequence[Dict[str, Any]]) -> List[float]:
+        return [self.compute(item, meta) for item, meta in zip(items, metas)]
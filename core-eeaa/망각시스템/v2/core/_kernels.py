@@ -0,0 +1,35 @@
+"""Optional Numba kernels for batch score aggregation.
+
+Importing this module requires numpy and numba; DecisionEngine falls back
+to its pure-Python loop when they are not installed.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def clip_and_weight(scores, w, out):
+    """out[i] = clip01(sum of w[:5] * scores[:5, i] - w[5] * risk - w[6] * redundancy)
+
+    ``scores`` is (7, N) in ScoreVector field order. Operations are kept in
+    the same order as DecisionEngine._aggregate (no fastmath), so results
+    match the Python path exactly.
+    """
+    for i in prange(scores.shape[1]):
+        agg = (w[0] * scores[0, i] + w[1] * scores[1, i] + w[2] * scores[2, i]
+               + w[3] * scores[3, i] + w[4] * scores[4, i])
+        adjusted = agg - w[5] * scores[5, i] - w[6] * scores[6, i]
+        out[i] = max(0.0, min(1.0, adjusted))
+
+
+def aggregate_columns(columns, weights):
+    """Run clip_and_weight over ScoreMatrix columns (float64 buffers)."""
+    scores = np.vstack([np.frombuffer(col, dtype=np.float64) for col in columns])
+    out = np.empty(scores.shape[1], dtype=np.float64)
+    clip_and_weight(scores, np.asarray(weights, dtype=np.float64), out)
+    return out
+
+
+# Compile (or load from cache) at import so the first batch does not pay for it
+aggregate_columns([np.zeros(1)] * 7, [0.0] * 7)
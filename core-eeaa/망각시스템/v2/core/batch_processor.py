@@ -4,31 +4,56 @@ Processes items with priority ordering so that low-value items are handled
 first under budget pressure, while high-value items are preserved or deferred.
 """
 
+from operator import itemgetter
 from typing import Any, Dict, Iterable, List, Tuple
 
 from .intelligent_forgetting import IntelligentForgettingSystem
+from .multidimensional_analyzer import ScoreVector
+
+# C-level sort key; the aggregates are already computed, so sorting never calls back into Python
+_by_aggregate = itemgetter(0)
+
+
+def prioritize(
+    system: IntelligentForgettingSystem,
+    items: Iterable[Tuple[Any, Dict[str, Any]]],
+) -> List[Tuple[float, Any, Dict[str, Any], ScoreVector]]:
+    """Pre-score a batch and return (aggregate, item, meta, scores), lowest aggregate first."""
+
+    pairs = list(items)
+    batch_items = [item for item, _ in pairs]
+    batch_metas = [meta for _, meta in pairs]
+    matrix = system.analyzer.analyze_matrix(batch_items, batch_metas)
+    aggregates = system.decision_engine.aggregate_batch(matrix)
+    score_vectors = matrix.rows()
+    scored: List[Tuple[float, Any, Dict[str, Any], ScoreVector]] = list(
+        zip(aggregates, batch_items, batch_metas, score_vectors))
+    scored.sort(key=_by_aggregate)
+    return scored
 
 
 def process_batch(
     system: IntelligentForgettingSystem,
     items: Iterable[Tuple[Any, Dict[str, Any]]],
+    bucket_actions: bool = False,
 ) -> List[Dict[str, Any]]:
     """Process a batch of (item, meta) pairs with priority ordering.
 
     Priority is determined by the system's aggregate score; lower scores are
     processed first so that budget pressure can be alleviated early.
-    """
 
-    # Pre-score to decide order
-    scored: List[Tuple[float, Any, Dict[str, Any]]] = []
-    for item, meta in items:
-        scores = system.analyzer.analyze(item, meta)
-        agg = system.decision_engine._aggregate(scores, meta)  # type: ignore
-        scored.append((agg, item, meta))
+    With ``bucket_actions`` the sorted batch is planned against one context
+    snapshot and dispatched per action (see
+    ``IntelligentForgettingSystem.process_bucketed``); by default each item
+    is planned after the previous one has been applied.
+    """
 
-    # Process low-score first
-    scored.sort(key=lambda t: t[0])
+    # Pre-score the whole batch to decide order, then process low-score first
+    # reusing the pre-computed scores
+    scored = prioritize(system, items)
+    if bucket_actions:
+        return system.process_bucketed([(item, meta, scores) for _, item, meta, scores in scored])
     results: List[Dict[str, Any]] = []
-    for _, item, meta in scored:
-        results.append(system.process_item(item, meta))
+    for _, item, meta, scores in scored:
+        results.append(system.process_item(item, meta, scores=scores))
     return results
@@ -1,7 +1,17 @@
 """Context and state holders for budgets and reversibility (thread-safe)."""
 
 import threading
-from typing import Any, Dict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+
+class _TLAccumulator(threading.local):
+    """Per-thread usage deltas collected while a ``deferred()`` scope is open."""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.storage_delta = 0.0
+        self.semantic_delta = 0.0
 
 
 class BudgetState:
@@ -10,6 +20,7 @@ class BudgetState:
         self.semantic_budget = semantic_budget
         self.utilization = {"storage": 0.0, "semantic": 0.0}
         self._lock = threading.Lock()
+        self._pending = _TLAccumulator()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -19,6 +30,38 @@ class BudgetState:
         }
 
     def record_usage(self, storage_delta: float = 0.0, semantic_delta: float = 0.0) -> None:
+        pending = self._pending
+        if pending.depth:
+            pending.storage_delta += storage_delta
+            pending.semantic_delta += semantic_delta
+            return
+        self._apply(storage_delta, semantic_delta)
+
+    def flush(self) -> None:
+        """Apply this thread's pending deltas under a single lock acquisition."""
+        pending = self._pending
+        storage_delta, semantic_delta = pending.storage_delta, pending.semantic_delta
+        pending.storage_delta = pending.semantic_delta = 0.0
+        if storage_delta or semantic_delta:
+            self._apply(storage_delta, semantic_delta)
+
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        """Accumulate ``record_usage`` calls thread-locally and flush them on exit.
+
+        Utilization (and therefore ``to_dict``) does not reflect deltas recorded
+        inside the scope until it closes; the clamp at zero applies to the sum.
+        """
+        pending = self._pending
+        pending.depth += 1
+        try:
+            yield
+        finally:
+            pending.depth -= 1
+            if not pending.depth:
+                self.flush()
+
+    def _apply(self, storage_delta: float, semantic_delta: float) -> None:
         with self._lock:
             self.utilization["storage"] = max(0.0, self.utilization["storage"] + storage_delta)
             self.utilization["semantic"] = max(0.0, self.utilization["semantic"] + semantic_delta)
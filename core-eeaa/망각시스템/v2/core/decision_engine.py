@@ -1,19 +1,64 @@
 """Decision engine for mapping scores and constraints to strategies."""
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
-from .multidimensional_analyzer import ScoreVector
+from .multidimensional_analyzer import ScoreMatrix, ScoreVector
 
+try:
+    from ._kernels import aggregate_columns
+except ImportError:  # numpy/numba not installed: pure-Python batch aggregation
+    aggregate_columns = None
 
-@dataclass
+# Smallest ScoreMatrix handed to the compiled kernel; below this, conversion costs more
+_KERNEL_MIN_BATCH = 1024
+
+# Meta flag bits, computed once per item by DecisionEngine.meta_flags
+REGULATORY_HOLD = 1
+PROTECTED = 2
+PII = 4
+CLASS = 8  # item class has an entry in class_policies
+ALLOW = 16  # allow_processing
+APPROVED = 32  # approval_token present
+IRREVERSIBLE = 64  # allow_irreversible
+HARD_STOPS = REGULATORY_HOLD | PROTECTED | PII | CLASS
+
+
+@dataclass(slots=True, frozen=True)
 class StrategyPlan:
     action: str
-    params: Dict[str, Any] = field(default_factory=dict)
+    params: Mapping[str, Any] = field(default_factory=dict)
     rationale: Optional[str] = None
     target_stage: Optional[int] = None  # v1 9-stage compatibility
 
 
+_NO_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _shared_plan(action: str, params: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> StrategyPlan:
+    # Shared plans are handed to every caller, so their params must be read-only
+    return StrategyPlan(action=action, params=MappingProxyType(dict(params)) if params else _NO_PARAMS,
+                        **kwargs)
+
+
+# Shared instances for plans that carry no per-item data
+_PLAN_RETAIN_REGHOLD = _shared_plan("retain", rationale="Regulatory hold")
+_PLAN_PRESERVE_PROTECTED = _shared_plan("preserve", rationale="Protected class")
+_PLAN_RETAIN_PII_APPROVAL = _shared_plan("retain", rationale="PII processing requires approval token")
+_PLAN_PRESERVE_HIGH_RISK = _shared_plan("preserve", rationale="High risk -> preserve")
+_PLAN_RETAIN_IRREVERSIBLE_APPROVAL = _shared_plan("retain", rationale="Irreversible requires approval token")
+_PLAN_KEY_DESTROY = _shared_plan("key_destroy", target_stage=9, rationale="Irreversible gate approved")
+_PLAN_RETAIN_IRREVERSIBLE_BLOCKED = _shared_plan("retain", rationale="Irreversible gate blocked")
+_PLAN_PRESERVE_HIGH_SCORE = _shared_plan("preserve", rationale="High composite score")
+_PLAN_COMPRESS_LOSSLESS = _shared_plan("compress", params={"lossy": False},
+                                     rationale="Mid score -> lossless compression")
+_PLAN_SEMANTIC_PRESERVE = _shared_plan("semantic_preserve", rationale="Semantic value high -> preserve summary")
+_PLAN_ARCHIVE_LOW = _shared_plan("archive", rationale="Very low score -> archive")
+_PLAN_DELETE_PRESSURE = _shared_plan("delete", rationale="Budget pressure -> delete")
+_PLAN_ARCHIVE_NO_PRESSURE = _shared_plan("archive", rationale="Low score but no pressure -> archive")
+
+
 class DecisionEngine:
     """Maps score vectors + meta/constraints to a StrategyPlan.
 
@@ -47,21 +92,63 @@ class DecisionEngine:
         self.class_policies = class_policies or {}
         self.profiles = profiles or {}
 
+    @property
+    def class_policies(self) -> Dict[str, Dict[str, Any]]:
+        return self._class_policies
+
+    @class_policies.setter
+    def class_policies(self, policies: Dict[str, Dict[str, Any]]) -> None:
+        self._class_policies = policies or {}
+        # name -> (action, params, plan); rebuilt when the policy's action/params change,
+        # so in-place edits of the dict returned by the getter still take effect
+        self._class_plans: Dict[str, Tuple[str, Any, StrategyPlan]] = {}
+
+    def _class_plan(self, name: str) -> StrategyPlan:
+        pol = self._class_policies[name]
+        action, params = pol.get("action", "retain"), pol.get("params")
+        cached = self._class_plans.get(name)
+        if cached is None or cached[0] != action or cached[1] != params:
+            plan = _shared_plan(action, params, rationale=f"Class policy: {name}")
+            cached = self._class_plans[name] = (action, dict(params) if params else params, plan)
+        return cached[2]
+
     def _aggregate(self, scores: ScoreVector, meta: Dict[str, Any]) -> float:
-        score_dict = scores.to_dict()
+        # Read axes straight off the ScoreVector; weights may be swapped per class profile
+        w = self.weights
         # Apply penalties for risk/redundancy
         agg = (
-            self.weights.get("importance", 0) * score_dict.get("importance", 0)
-            + self.weights.get("usage", 0) * score_dict.get("usage", 0)
-            + self.weights.get("semantic", 0) * score_dict.get("semantic", 0)
-            + self.weights.get("temporal", 0) * score_dict.get("temporal", 0)
-            + self.weights.get("context", 0) * score_dict.get("context", 0)
+            w.get("importance", 0) * scores.importance
+            + w.get("usage", 0) * scores.usage
+            + w.get("semantic", 0) * scores.semantic
+            + w.get("temporal", 0) * scores.temporal
+            + w.get("context", 0) * scores.context
         )
-        risk_penalty = self.weights.get("risk", 0) * score_dict.get("risk", 0)
-        red_penalty = self.weights.get("redundancy", 0) * score_dict.get("redundancy", 0)
+        risk_penalty = w.get("risk", 0) * scores.risk
+        red_penalty = w.get("redundancy", 0) * scores.redundancy
         adjusted = agg - risk_penalty - red_penalty
         return max(0.0, min(1.0, adjusted))
 
+    def aggregate_batch(self, scores: Union[ScoreMatrix, Sequence[ScoreVector]]) -> List[float]:
+        """Composite scores for a batch; same as ``_aggregate`` per item.
+
+        The current weights are read once for the whole batch rather than
+        seven dict lookups per item. A ScoreMatrix is swept column-wise.
+        """
+        w = self.weights
+        wi, wu, ws, wt, wc = (w.get(k, 0) for k in ("importance", "usage", "semantic", "temporal", "context"))
+        wr, wd = w.get("risk", 0), w.get("redundancy", 0)
+        if isinstance(scores, ScoreMatrix):
+            if aggregate_columns is not None and len(scores) >= _KERNEL_MIN_BATCH:
+                return aggregate_columns(scores.columns, (wi, wu, ws, wt, wc, wr, wd)).tolist()
+            rows = zip(*scores.columns)
+        else:
+            rows = ((s.importance, s.usage, s.semantic, s.temporal, s.context, s.risk, s.redundancy)
+                    for s in scores)
+        return [
+            max(0.0, min(1.0, (wi * imp + wu * use + ws * sem + wt * tmp + wc * ctx) - wr * risk - wd * red))
+            for imp, use, sem, tmp, ctx, risk, red in rows
+        ]
+
     def _budget_pressure(self, budget_state: Optional[Dict[str, Any]]) -> bool:
         if not budget_state:
             return False
@@ -69,78 +156,107 @@ class DecisionEngine:
         storage_used = util.get("storage", 0.0)
         return storage_used >= budget_state.get("storage_budget", 1.0)
 
-    def select(self, scores: ScoreVector, meta: Dict[str, Any],
-               budget_state: Optional[Dict[str, Any]] = None,
-               reversibility_state: Optional[int] = None) -> StrategyPlan:
-        # apply class profile if any
-        data_class = meta.get("class")
-        if data_class and data_class in self.profiles:
-            self.weights = self.profiles[data_class]
-        else:
-            self.weights = self.weights or self.base_weights.copy()
+    def fast_path_preserve(self, risk: float, meta: Dict[str, Any], flags: Optional[int] = None) -> bool:
+        """True when ``select`` is bound to return the high-risk preserve plan.
 
-        agg = self._aggregate(scores, meta)
-        budget_pressure = self._budget_pressure(budget_state)
+        That rule reads only the risk axis and fires before the aggregate is
+        used, provided no hard stop or allow_processing applies.
+        """
+        if flags is None:
+            flags = self.meta_flags(meta)
+        return not flags & (HARD_STOPS | ALLOW) and risk >= self.risk_keep_threshold
 
+    def meta_flags(self, meta: Dict[str, Any]) -> int:
+        """Pack the meta constraint flags consulted by ``select`` into a bitmask."""
+        get = meta.get
+        data_class = get("class")
+        return (
+            (REGULATORY_HOLD if get("regulatory_hold") else 0)
+            | (PROTECTED if get("protected_class") else 0)
+            | (PII if get("pii") else 0)
+            | (CLASS if data_class and data_class in self._class_policies else 0)
+            | (ALLOW if get("allow_processing") else 0)
+            | (APPROVED if get("approval_token") else 0)
+            | (IRREVERSIBLE if get("allow_irreversible") else 0)
+        )
+
+    def _hard_stop(self, flags: int, meta: Dict[str, Any]) -> Optional[StrategyPlan]:
         # Hard stops / mandatory retention
-        if meta.get("regulatory_hold"):
-            return StrategyPlan(action="retain", rationale="Regulatory hold")
+        if flags & REGULATORY_HOLD:
+            return _PLAN_RETAIN_REGHOLD
 
-        if meta.get("protected_class"):
-            return StrategyPlan(action="preserve", rationale="Protected class")
+        if flags & PROTECTED:
+            return _PLAN_PRESERVE_PROTECTED
 
         # Class-based overrides
-        if data_class and data_class in self.class_policies:
-            pol = self.class_policies[data_class]
-            action = pol.get("action", "retain")
-            params = pol.get("params", {})
-            return StrategyPlan(action=action, params=params,
-                                rationale=f"Class policy: {data_class}")
+        if flags & CLASS:
+            return self._class_plan(meta["class"])
 
         # PII or high-risk data: default to preservation/masking unless approved
-        if self.pii_protect and meta.get("pii"):
-            if not meta.get("allow_processing"):
+        if self.pii_protect and flags & PII:
+            if not flags & ALLOW:
                 return StrategyPlan(action="mask", params={"profile": meta.get("mask_profile", "X+Y")},
                                     rationale="PII protection")
-            if not meta.get("approval_token"):
-                return StrategyPlan(action="retain", rationale="PII processing requires approval token")
+            if not flags & APPROVED:
+                return _PLAN_RETAIN_PII_APPROVAL
+        return None
+
+    def select(self, scores: ScoreVector, meta: Dict[str, Any],
+               budget_state: Optional[Dict[str, Any]] = None,
+               reversibility_state: Optional[int] = None,
+               flags: Optional[int] = None) -> StrategyPlan:
+        # apply class profile if any
+        data_class = meta.get("class")
+        if data_class and data_class in self.profiles:
+            self.weights = self.profiles[data_class]
+        else:
+            self.weights = self.weights or self.base_weights.copy()
+
+        # Callers may pass flags precomputed at ingestion; common items skip all hard stops
+        if flags is None:
+            flags = self.meta_flags(meta)
+        if flags & HARD_STOPS:
+            plan = self._hard_stop(flags, meta)
+            if plan is not None:
+                return plan
 
-        if scores.risk >= self.risk_keep_threshold and not meta.get("allow_processing"):
-            return StrategyPlan(action="preserve", rationale="High risk -> preserve")
+        if scores.risk >= self.risk_keep_threshold and not flags & ALLOW:
+            return _PLAN_PRESERVE_HIGH_RISK
 
         # Irreversible gate when already encrypted/distributed (stage >=7)
         if reversibility_state is not None and reversibility_state >= 7:
-            if meta.get("allow_irreversible"):
-                if not meta.get("approval_token"):
-                    return StrategyPlan(action="retain", rationale="Irreversible requires approval token")
-                return StrategyPlan(action="key_destroy", target_stage=9,
-                                    rationale="Irreversible gate approved")
-            return StrategyPlan(action="retain", rationale="Irreversible gate blocked")
+            if flags & IRREVERSIBLE:
+                if not flags & APPROVED:
+                    return _PLAN_RETAIN_IRREVERSIBLE_APPROVAL
+                return _PLAN_KEY_DESTROY
+            return _PLAN_RETAIN_IRREVERSIBLE_BLOCKED
+
+        # Rules above never read the aggregate, so short-circuited scores stop before it
+        agg = self._aggregate(scores, meta)
+        budget_pressure = self._budget_pressure(budget_state)
 
         # High value → preserve or predictive cache
         if agg >= self.thresholds["preserve"]:
-            return StrategyPlan(action="preserve", rationale="High composite score")
+            return _PLAN_PRESERVE_HIGH_SCORE
 
         # Mid-high → lossless compression (retain reversibility)
         if agg >= self.thresholds["compress"]:
-            return StrategyPlan(action="compress", params={"lossy": False},
-                                rationale="Mid score -> lossless compression")
+            return _PLAN_COMPRESS_LOSSLESS
 
         # Mid-low → masking/semantic preservation
         if agg >= self.thresholds["mask"]:
             # If semantic value is relatively high, preserve semantics instead of raw masking
             if scores.semantic >= 0.55 and scores.importance >= 0.45:
-                return StrategyPlan(action="semantic_preserve",
-                                    rationale="Semantic value high -> preserve summary")
+                return _PLAN_SEMANTIC_PRESERVE
             profile = meta.get("mask_profile", "X+Y")
             return StrategyPlan(action="mask", params={"profile": profile},
                                 rationale="Low-mid score -> masking")
 
         # Low score: archive by default; if under budget pressure, delete
         if agg >= self.thresholds["archive"]:
-            return StrategyPlan(action="archive", rationale="Very low score -> archive")
+            return _PLAN_ARCHIVE_LOW
 
         if budget_pressure:
-            return StrategyPlan(action="delete", rationale="Budget pressure -> delete")
+            return _PLAN_DELETE_PRESSURE
 
-        return StrategyPlan(action="archive", rationale="Low score but no pressure -> archive")
+        return _PLAN_ARCHIVE_NO_PRESSURE
@@ -1,6 +1,6 @@
 """Orchestrator wiring analyzer, decision engine, strategies, and learning."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .context_manager import ContextManager
 from .decision_engine import DecisionEngine, StrategyPlan
@@ -20,7 +20,8 @@ class IntelligentForgettingSystem:
                  context_manager: Optional[ContextManager] = None,
                  ledger: Optional[Ledger] = None,
                  storage_adapter: Optional[StorageAdapter] = None,
-                 metrics: Optional[Metrics] = None):
+                 metrics: Optional[Metrics] = None,
+                 early_exit: bool = False):
         self.analyzer = analyzer
         self.decision_engine = decision_engine
         self.strategy_registry = strategy_registry
@@ -29,35 +30,141 @@ class IntelligentForgettingSystem:
         self.ledger = ledger or Ledger()
         self.storage = storage_adapter or StorageAdapter()
         self.metrics = metrics or Metrics()
+        # Skip the remaining axes when risk alone decides preserve (see analyze_fast_path)
+        self.early_exit = early_exit
 
-    def process_item(self, item: Any, meta: Dict[str, Any]) -> Dict[str, Any]:
-        scores: ScoreVector = self.analyzer.analyze(item, meta)
+    def clear_cache(self) -> None:
+        """Drop memoized axis scores.
+
+        Only scoring is memoized (see ``MultidimensionalAnalyzer``); plans
+        depend on the live budget/reversibility snapshot and strategies have
+        side effects, so ``process_item`` itself is never cached.
+        """
+        self.analyzer.clear_cache()
+
+    def close(self) -> None:
+        """Flush and close the ledger's log file; logging again reopens it."""
+        self.ledger.close()
+
+    def process_item(self, item: Any, meta: Dict[str, Any],
+                     scores: Optional[ScoreVector] = None) -> Dict[str, Any]:
+        # Callers that already scored the item (e.g. batch pre-scoring) pass it in
+        if scores is None:
+            scores = self._score(item, meta)
+        ctx_snapshot = self.context_manager.snapshot()
+        plan = self._plan(scores, meta, ctx_snapshot)
+        strategy = self._strategy(plan.action)
+
+        result = strategy.apply(item=item, meta=meta, plan=plan, scores=scores,
+                                context=self.context_manager)
+        # Track budget deltas heuristically based on meta size hint
+        self.context_manager.budget_state.record_usage(
+            storage_delta=self._storage_delta(plan.action, meta))
+        return self._finish(scores, meta, plan, result, ctx_snapshot)
+
+    def process_batch_fused(self, items: Iterable[Tuple[Any, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Score, plan and apply each (item, meta) in a single pass, in input order.
+
+        Equivalent to calling ``process_item`` per pair, but no batch-wide
+        score or plan lists are built and per-item lookups are hoisted out of
+        the loop. Use ``batch_processor.process_batch`` when priority order
+        matters.
+        """
+        pairs = items if isinstance(items, list) else list(items)
+        records: List[Optional[Dict[str, Any]]] = [None] * len(pairs)
+        score, plan_for, finish = self._score, self._plan, self._finish
+        snapshot = self.context_manager.snapshot
+        record_usage = self.context_manager.budget_state.record_usage
+        context = self.context_manager
+        strategies: Dict[str, Any] = {}
+        for i, (item, meta) in enumerate(pairs):
+            scores = score(item, meta)
+            ctx_snapshot = snapshot()
+            plan = plan_for(scores, meta, ctx_snapshot)
+            strategy = strategies.get(plan.action)
+            if strategy is None:
+                strategy = strategies[plan.action] = self._strategy(plan.action)
+            result = strategy.apply(item=item, meta=meta, plan=plan, scores=scores, context=context)
+            record_usage(storage_delta=self._storage_delta(plan.action, meta))
+            records[i] = finish(scores, meta, plan, result, ctx_snapshot)
+        return records
+
+    def process_bucketed(self, entries: List[Tuple[Any, Dict[str, Any], ScoreVector]]
+                         ) -> List[Dict[str, Any]]:
+        """Plan every entry, then dispatch one strategy call per action bucket.
+
+        All plans are taken against a single context snapshot, so budget and
+        reversibility changes made by earlier items in the batch do not feed
+        back into later decisions (unlike repeated ``process_item`` calls).
+        Strategies exposing ``apply_batch`` receive the whole bucket; budget
+        deltas are recorded once per bucket and applied in one flush.
+        Records keep the input order.
+        """
         ctx_snapshot = self.context_manager.snapshot()
-        plan: StrategyPlan = self.decision_engine.select(
+        buckets: Dict[str, List[int]] = {}
+        plans: List[StrategyPlan] = []
+        for idx, (_, meta, scores) in enumerate(entries):
+            plan = self._plan(scores, meta, ctx_snapshot)
+            plans.append(plan)
+            buckets.setdefault(plan.action, []).append(idx)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(entries)
+        budget = self.context_manager.budget_state
+        # Plans are fixed already, so all budget updates can land in one flush
+        with budget.deferred():
+            for action, indices in buckets.items():
+                strategy = self._strategy(action)
+                batch = [(entries[i][0], entries[i][1], plans[i], entries[i][2]) for i in indices]
+                if hasattr(strategy, "apply_batch"):
+                    bucket_results = strategy.apply_batch(batch, context=self.context_manager)
+                else:
+                    bucket_results = [strategy.apply(item=item, meta=meta, plan=plan, scores=scores,
+                                                     context=self.context_manager)
+                                      for item, meta, plan, scores in batch]
+                for i, result in zip(indices, bucket_results):
+                    results[i] = result
+                budget.record_usage(
+                    storage_delta=sum(self._storage_delta(action, meta) for _, meta, _, _ in batch))
+
+        return [self._finish(scores, meta, plan, result, ctx_snapshot)
+                for (_, meta, scores), plan, result in zip(entries, plans, results)]
+
+    def _score(self, item: Any, meta: Dict[str, Any]) -> ScoreVector:
+        if self.early_exit:
+            scores = self.analyzer.analyze_fast_path(item, meta, self.decision_engine)
+            if scores is not None:
+                return scores
+        return self.analyzer.analyze(item, meta)
+
+    def _plan(self, scores: ScoreVector, meta: Dict[str, Any],
+              ctx_snapshot: Dict[str, Any]) -> StrategyPlan:
+        return self.decision_engine.select(
             scores,
             meta,
             budget_state=ctx_snapshot.get("budget_state"),
             reversibility_state=ctx_snapshot.get("reversibility_stage"),
         )
 
-        strategy = self.strategy_registry.get(plan.action)
+    def _strategy(self, action: str) -> Any:
+        strategy = self.strategy_registry.get(action)
         if strategy is None:
-            raise ValueError(f"Unknown strategy: {plan.action}")
+            raise ValueError(f"Unknown strategy: {action}")
+        return strategy
 
-        result = strategy.apply(item=item, meta=meta, plan=plan, scores=scores,
-                                context=self.context_manager)
+    @staticmethod
+    def _storage_delta(action: str, meta: Dict[str, Any]) -> float:
+        size = float(meta.get("size_bytes", 1.0))
+        if action in {"delete", "key_destroy"}:
+            return -size
+        if action in {"compress", "mask", "archive", "semantic_preserve"}:
+            return -0.5 * size
+        return 0.0
+
+    def _finish(self, scores: ScoreVector, meta: Dict[str, Any], plan: StrategyPlan,
+                result: Dict[str, Any], ctx_snapshot: Dict[str, Any]) -> Dict[str, Any]:
         self.learning_optimizer.update(result.get("feedback", {}))
         self.metrics.record_action(plan.action)
 
-        # Track budget deltas heuristically based on meta size hint
-        size = float(meta.get("size_bytes", 1.0))
-        if plan.action in {"delete", "key_destroy"}:
-            self.context_manager.budget_state.record_usage(storage_delta=-size)
-        elif plan.action in {"compress", "mask", "archive", "semantic_preserve"}:
-            self.context_manager.budget_state.record_usage(storage_delta=-0.5 * size)
-        else:
-            self.context_manager.budget_state.record_usage(storage_delta=0.0)
-
         record = {
             "scores": scores.to_dict(),
             "plan": plan,
@@ -2,39 +2,96 @@
 
 import json
 import hashlib
+from collections import deque
+from dataclasses import fields, is_dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json for the log file
+    orjson = None
+
+# Reused for hash payloads; json.dumps with non-default options builds a new encoder per call
+_PAYLOAD_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+# Values of these exact types are stored as-is; anything else goes through _plain
+_PLAIN_TYPES = frozenset({dict, list, tuple, str, int, float, bool, type(None)})
+
+
+def _plain(value: Any) -> Any:
+    # Dataclasses (e.g. StrategyPlan) become a shallow field dict, other objects their __dict__
+    if isinstance(value, (dict, list, tuple, str, int, float)):
+        return value  # subclasses (OrderedDict, IntEnum, ...) are already serializable
+    if is_dataclass(value) and not isinstance(value, type):
+        # Read-only params of shared plans are MappingProxyType, which JSON encoders reject
+        return {f.name: dict(v) if isinstance(v := getattr(value, f.name), MappingProxyType) else v
+                for f in fields(value)}
+    return getattr(value, "__dict__", value)
+
+
+def _dumps_line(obj: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 class Ledger:
-    def __init__(self, logfile: Optional[Path] = None) -> None:
-        self.events: List[Dict[str, Any]] = []
+    def __init__(self, logfile: Optional[Path] = None, max_events: Optional[int] = None) -> None:
+        # With max_events only the newest events are kept in memory (ring buffer);
+        # the hash chain and the log file still cover every event.
+        self.events: Union[List[Dict[str, Any]], Deque[Dict[str, Any]]] = (
+            deque(maxlen=max_events) if max_events else []
+        )
         self.logfile = logfile
         self._last_hash = ""
+        self._last_digest = b""  # raw bytes of _last_hash, chained into the next digest
+        self._fh = None  # opened lazily on the first logged event
 
     def log(self, event: Dict[str, Any]) -> None:
         # ensure event is JSON-serializable
-        serializable = {}
-        for k, v in event.items():
-            if hasattr(v, "__dict__"):
-                serializable[k] = v.__dict__
-            else:
-                serializable[k] = v
+        plain_types = _PLAIN_TYPES
+        serializable = {k: v if type(v) in plain_types else _plain(v) for k, v in event.items()}
 
+        # hash = sha256(prev_digest || event payload); hex digests are stored on the event only
+        payload = _PAYLOAD_ENCODER.encode(serializable).encode("utf-8")
+        h = hashlib.sha256(self._last_digest)
+        h.update(payload)
+        self._last_digest = h.digest()
         serializable["prev_hash"] = self._last_hash
-        payload = json.dumps(serializable, ensure_ascii=False)
-        self._last_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        self._last_hash = self._last_digest.hex()
         serializable["hash"] = self._last_hash
 
         self.events.append(serializable)
         if self.logfile:
-            line = json.dumps(serializable, ensure_ascii=False)
-            self.logfile.parent.mkdir(parents=True, exist_ok=True)
-            with self.logfile.open("a", encoding="utf-8") as f:
-                f.write(line + "\n")
+            if self._fh is None:
+                self.logfile.parent.mkdir(parents=True, exist_ok=True)
+                self._fh = self.logfile.open("ab", buffering=1 << 16)
+            self._fh.write(_dumps_line(serializable))
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self) -> "Ledger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def tail(self, n: int = 10) -> List[Dict[str, Any]]:
-        return self.events[-n:]
+        events = self.events
+        if isinstance(events, list):
+            return events[-n:]
+        return list(islice(events, max(0, len(events) - n) if n else 0, None))
 
     def log_error(self, message: str, context: Optional[Dict[str, Any]] = None) -> None:
         event = {"type": "error", "message": message, "context": context or {}}
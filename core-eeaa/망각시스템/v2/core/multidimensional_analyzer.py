@@ -4,11 +4,14 @@ This module wires individual axis calculators (importance, usage, semantic,
 temporal, context, risk, redundancy) into a normalized ScoreVector.
 """
 
+import threading
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreVector:
     importance: float
     usage: float
@@ -17,9 +20,11 @@ class ScoreVector:
     context: float
     risk: float
     redundancy: float
+    # Set by analyze_fast_path: only importance and risk were computed
+    short_circuit: bool = False
 
-    def to_dict(self) -> Dict[str, float]:
-        return {
+    def to_dict(self) -> Dict[str, Union[float, bool]]:
+        scores: Dict[str, Union[float, bool]] = {
             "importance": self.importance,
             "usage": self.usage,
             "semantic": self.semantic,
@@ -28,17 +33,63 @@ class ScoreVector:
             "risk": self.risk,
             "redundancy": self.redundancy,
         }
+        if self.short_circuit:
+            # Marks the zeroed axes as not computed rather than scored 0
+            scores["short_circuit"] = True
+        return scores
 
 
-def _clip01(value: float) -> float:
-    return max(0.0, min(1.0, value))
+# Column indices of ScoreMatrix, in ScoreVector field order
+IMPORTANCE, USAGE, SEMANTIC, TEMPORAL, CONTEXT, RISK, REDUNDANCY = range(7)
+AXES = ("importance", "usage", "semantic", "temporal", "context", "risk", "redundancy")
+
+
+class ScoreMatrix:
+    """Column-major (SoA) scores for a batch: one packed float array per axis.
+
+    ``column(axis)`` gives batch consumers a whole axis at once; ``row`` and
+    ``rows`` rebuild per-item ScoreVectors for the single-item APIs.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: Sequence[Sequence[float]]):
+        if len(columns) != len(AXES):
+            raise ValueError(f"ScoreMatrix needs {len(AXES)} columns, got {len(columns)}")
+        self.columns = tuple(array("d", col) for col in columns)
+
+    def __len__(self) -> int:
+        return len(self.columns[0])
+
+    def column(self, axis: int) -> array:
+        return self.columns[axis]
+
+    def row(self, i: int) -> ScoreVector:
+        return ScoreVector(*(col[i] for col in self.columns))
+
+    def rows(self) -> List[ScoreVector]:
+        return [ScoreVector(*row) for row in zip(*self.columns)]
+
+    def to_dict(self, i: int) -> Dict[str, float]:
+        return {name: col[i] for name, col in zip(AXES, self.columns)}
+
+
+# (meta key, axis index, weight) rows of the fused linear table
+_FusedTerms = Tuple[Tuple[str, int, float], ...]
+
+# Meta value types that can go into a memo fingerprint; other types disable caching
+_FINGERPRINT_TYPES = frozenset({str, int, float, bool, type(None)})
+# Axes whose results may be memoized: everything but redundancy, which depends
+# on the near-duplicate index state and is always recomputed
+_MEMO_AXES = tuple(range(REDUNDANCY))
 
 
 class MultidimensionalAnalyzer:
     """Composes axis calculators into a normalized ScoreVector."""
 
     def __init__(self, *, importance_calc, usage_analyzer, semantic_analyzer,
-                 temporal_modeler, context_analyzer, redundancy_analyzer, risk_analyzer):
+                 temporal_modeler, context_analyzer, redundancy_analyzer, risk_analyzer,
+                 memo_size: int = 8192):
         self.importance_calc = importance_calc
         self.usage_analyzer = usage_analyzer
         self.semantic_analyzer = semantic_analyzer
@@ -46,20 +97,180 @@ class MultidimensionalAnalyzer:
         self.context_analyzer = context_analyzer
         self.redundancy_analyzer = redundancy_analyzer
         self.risk_analyzer = risk_analyzer
+        # Calculators in ScoreVector field order
+        self._calcs = (importance_calc, usage_analyzer, semantic_analyzer, temporal_modeler,
+                       context_analyzer, risk_analyzer, redundancy_analyzer)
+        self._fused_axes, self._fused_terms = self._fuse_linear(self._calcs)
+        # (axis, meta key) for fused calculators that accept an upstream score
+        self._fused_overrides = tuple((axis, self._calcs[axis].score_key) for axis in self._fused_axes
+                                      if getattr(self._calcs[axis], "score_key", None))
+        self._unfused = tuple((axis, calc.compute) for axis, calc in enumerate(self._calcs)
+                              if axis not in self._fused_axes)
+        # LRU of clipped _MEMO_AXES scores keyed by (item id, meta fingerprint)
+        self._memo: "OrderedDict[Tuple[Any, frozenset], Tuple[float, ...]]" = OrderedDict()
+        self._memo_size = memo_size
+        self._memo_lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        """Drop memoized axis scores (e.g. after calculators are reconfigured)."""
+        with self._memo_lock:
+            self._memo.clear()
+
+    def _memo_key(self, item: Any, meta: Dict[str, Any]) -> Optional[Tuple[Any, frozenset]]:
+        if not self._memo_size:
+            return None
+        item_id = meta.get("id")
+        if item_id is None and isinstance(item, dict):
+            item_id = item.get("id")
+        if type(item_id) not in (str, int):
+            return None
+        scalar = _FINGERPRINT_TYPES
+        for v in meta.values():
+            if type(v) not in scalar:
+                return None
+        return item_id, frozenset(meta.items())
+
+    def _memo_get(self, key: Tuple[Any, frozenset]) -> Optional[Tuple[float, ...]]:
+        with self._memo_lock:
+            hit = self._memo.get(key)
+            if hit is not None:
+                self._memo.move_to_end(key)
+            return hit
+
+    def _memo_put(self, key: Tuple[Any, frozenset], values: Tuple[float, ...]) -> None:
+        with self._memo_lock:
+            memo = self._memo
+            memo[key] = values
+            memo.move_to_end(key)
+            while len(memo) > self._memo_size:
+                memo.popitem(last=False)
+
+    @staticmethod
+    def _fuse_linear(calcs: Sequence[Any]) -> Tuple[Tuple[int, ...], _FusedTerms]:
+        """Flatten the weights of linear calculators into one table.
+
+        Calculators exposing non-empty ``linear_weights`` are scored together in
+        a single walk over (key, axis, weight) rows instead of one weighted
+        sum per calculator.
+        """
+        axes: List[int] = []
+        terms: List[Tuple[str, int, float]] = []
+        for axis, calc in enumerate(calcs):
+            linear = getattr(calc, "linear_weights", None)
+            if not linear:
+                continue
+            axes.append(axis)
+            terms.extend((key, axis, weight) for key, weight in linear)
+        return tuple(axes), tuple(terms)
+
+    def _linear_scores(self, meta: Dict[str, Any]) -> List[float]:
+        values = [0.0] * len(self._calcs)
+        get = meta.get
+        for key, axis, weight in self._fused_terms:
+            values[axis] += weight * float(get(key, 0.5))
+        for axis, key in self._fused_overrides:
+            pre = get(key)
+            if pre is not None:
+                values[axis] = float(pre)
+        return values
 
     def analyze(self, item: Any, meta: Dict[str, Any]) -> ScoreVector:
         """Return a ScoreVector in [0,1]^7 for the given item.
 
         Each calculator should already apply its own normalization; we clip as a
-        safety net to keep scores within bounds.
+        safety net to keep scores within bounds. Items with a str/int id and
+        scalar-only meta reuse memoized scores for every axis but redundancy.
+        """
+
+        key = self._memo_key(item, meta)
+        if key is not None:
+            hit = self._memo_get(key)
+            if hit is not None:
+                redundancy = self.redundancy_analyzer.compute(item, meta)
+                return ScoreVector(*hit, max(0.0, min(1.0, redundancy)))
+        values = self._linear_scores(meta)
+        for axis, compute in self._unfused:
+            values[axis] = compute(item, meta)
+        # Clip inline: one comprehension instead of a helper call per axis
+        clipped = [max(0.0, min(1.0, v)) for v in values]
+        if key is not None:
+            self._memo_put(key, tuple(clipped[:REDUNDANCY]))
+        return ScoreVector(*clipped)
+
+    def analyze_fast_path(self, item: Any, meta: Dict[str, Any], decision_engine: Any,
+                          flags: Optional[int] = None) -> Optional[ScoreVector]:
+        """Score only what is needed when the risk axis alone decides ``preserve``.
+
+        Risk is computed first; if ``decision_engine.fast_path_preserve`` holds,
+        the other axes cannot change the plan, so only importance is added and
+        the rest stay 0.0 with ``short_circuit=True``. Returns None otherwise,
+        and callers fall back to ``analyze``. Short-circuited items are not
+        memoized and do not enter the redundancy index.
         """
 
-        return ScoreVector(
-            importance=_clip01(self.importance_calc.compute(item, meta)),
-            usage=_clip01(self.usage_analyzer.compute(item, meta)),
-            semantic=_clip01(self.semantic_analyzer.compute(item, meta)),
-            temporal=_clip01(self.temporal_modeler.compute(item, meta)),
-            context=_clip01(self.context_analyzer.compute(item, meta)),
-            risk=_clip01(self.risk_analyzer.compute(item, meta)),
-            redundancy=_clip01(self.redundancy_analyzer.compute(item, meta)),
-        )
+        risk = max(0.0, min(1.0, self.risk_analyzer.compute(item, meta)))
+        if not decision_engine.fast_path_preserve(risk, meta, flags):
+            return None
+        importance = max(0.0, min(1.0, self.importance_calc.compute(item, meta)))
+        return ScoreVector(importance, 0.0, 0.0, 0.0, 0.0, risk, 0.0, short_circuit=True)
+
+    def analyze_batch(self, items: Sequence[Any], metas: Sequence[Dict[str, Any]]) -> List[ScoreVector]:
+        """Per-item ScoreVectors for a batch; see ``analyze_matrix``."""
+
+        return self.analyze_matrix(items, metas).rows()
+
+    def analyze_matrix(self, items: Sequence[Any], metas: Sequence[Dict[str, Any]]) -> ScoreMatrix:
+        """Score a whole batch axis by axis into a ScoreMatrix.
+
+        Linear calculators share the fused per-item walk; others exposing
+        ``compute_batch`` score every item in one call, the rest fall back to
+        per-item ``compute``. Memoized items skip all axes but redundancy,
+        which always runs over the full batch in order. Results match
+        ``analyze``.
+        """
+
+        keys = [self._memo_key(item, meta) for item, meta in zip(items, metas)]
+        hits = [self._memo_get(key) if key is not None else None for key in keys]
+        todo = [i for i, hit in enumerate(hits) if hit is None]
+        if len(todo) == len(keys):
+            todo_items, todo_metas = items, metas
+        else:
+            todo_items = [items[i] for i in todo]
+            todo_metas = [metas[i] for i in todo]
+
+        computed = self._columns(todo_items, todo_metas, _MEMO_AXES)
+        columns = [[0.0] * len(keys) for _ in _MEMO_AXES]
+        for i, hit in enumerate(hits):
+            if hit is not None:
+                for axis in _MEMO_AXES:
+                    columns[axis][i] = hit[axis]
+        for j, i in enumerate(todo):
+            row = tuple(col[j] for col in computed)
+            for axis in _MEMO_AXES:
+                columns[axis][i] = row[axis]
+            if keys[i] is not None:
+                self._memo_put(keys[i], row)
+        columns.extend(self._columns(items, metas, (REDUNDANCY,)))
+        return ScoreMatrix(columns)
+
+    def _columns(self, items: Sequence[Any], metas: Sequence[Dict[str, Any]],
+                 axes: Iterable[int]) -> List[List[float]]:
+        """Clipped score columns for the given axes, in the order requested."""
+        axes = tuple(axes)
+        fused = self._fused_axes
+        linear_rows = ([self._linear_scores(meta) for meta in metas]
+                       if any(axis in fused for axis in axes) else [])
+        columns = []
+        for axis in axes:
+            calc = self._calcs[axis]
+            if axis in fused:
+                column = [row[axis] for row in linear_rows]
+            else:
+                compute_batch = getattr(calc, "compute_batch", None)
+                if compute_batch is not None:
+                    column = compute_batch(items, metas)
+                else:
+                    column = [calc.compute(item, meta) for item, meta in zip(items, metas)]
+            # Clip column-wise to [0, 1]
+            columns.append([max(0.0, min(1.0, v)) for v in column])
+        return columns
@@ -1,9 +1,76 @@
 """Parallel batch processing using ThreadPoolExecutor."""
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, Iterable, List, Tuple
+import atexit
+import heapq
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from .intelligent_forgetting import IntelligentForgettingSystem
+from ..utils.content import extract_content
+
+# Below this many items the pool's scheduling overhead outweighs any overlap
+MIN_PARALLEL_BATCH = 16
+
+# Estimated work (in _cost units, i.e. content bytes) one extra worker must have to pay off;
+# every item also counts ITEM_BASE_COST for scoring and planning regardless of content
+COST_PER_WORKER = 16384
+ITEM_BASE_COST = 256
+
+# One persistent pool sized to the configured worker count, created on first use
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_SIZE = 0
+_POOL_LOCK = threading.Lock()
+
+
+def _submit_all(workers: int, fn: Callable[[Any], Any], args: List[Any]) -> List[Future]:
+    """Submit ``fn(arg)`` per arg to the shared ``workers``-thread pool.
+
+    A different size replaces the pool. Submission happens under the lock,
+    so a concurrent resize can only shut the old pool down after this
+    batch's futures are queued; shutdown(wait=False) still runs them.
+    """
+    global _POOL, _POOL_SIZE
+    with _POOL_LOCK:
+        stale = None
+        if _POOL is None or _POOL_SIZE != workers:
+            stale = _POOL
+            _POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ifs")
+            _POOL_SIZE = workers
+        futures = [_POOL.submit(fn, arg) for arg in args]
+    if stale is not None:
+        # Running batches keep their futures; idle threads exit once drained
+        stale.shutdown(wait=False)
+    return futures
+
+
+def _lpt_slices(costs: List[int], slices: int) -> List[List[int]]:
+    """Split indices into ``slices`` lists of similar total cost (longest first)."""
+    loads = [(0, s) for s in range(slices)]
+    assigned: List[List[int]] = [[] for _ in range(slices)]
+    for i in sorted(range(len(costs)), key=costs.__getitem__, reverse=True):
+        load, s = heapq.heappop(loads)
+        assigned[s].append(i)
+        heapq.heappush(loads, (load + costs[i] + ITEM_BASE_COST, s))
+    return assigned
+
+
+def _cost(pair: Tuple[Any, Dict[str, Any]]) -> int:
+    # Content length is a cheap proxy for per-item work (masking, compression)
+    content = extract_content(*pair)
+    return len(content) if isinstance(content, (str, bytes)) else 0
+
+
+def shutdown_pool(wait: bool = True) -> None:
+    """Shut down the cached worker pool; the next batch creates a fresh one."""
+    global _POOL, _POOL_SIZE
+    with _POOL_LOCK:
+        pool, _POOL, _POOL_SIZE = _POOL, None, 0
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+atexit.register(shutdown_pool)
 
 
 def process_batch_parallel(
@@ -12,17 +79,35 @@ def process_batch_parallel(
     max_workers: int = 4,
 ) -> List[Dict[str, Any]]:
     items_list = list(items)
-    # Snapshot max_workers from config if exists
+    # Snapshot max_workers / min batch size from config if exists
     cfg_workers = max_workers
+    min_batch = MIN_PARALLEL_BATCH
+    cost_per_worker = COST_PER_WORKER
     try:
-        cfg_workers = int(system.decision_engine.thresholds.get("parallel_workers", max_workers))
+        thresholds = system.decision_engine.thresholds
+        cfg_workers = int(thresholds.get("parallel_workers", max_workers))
+        min_batch = int(thresholds.get("parallel_min_batch", MIN_PARALLEL_BATCH))
+        cost_per_worker = max(1, int(thresholds.get("parallel_cost_per_worker", COST_PER_WORKER)))
     except Exception:
         pass
 
-    def worker(pair):
-        item, meta = pair
-        return system.process_item(item, meta)
+    def worker(indices):
+        return [system.process_item(*items_list[i]) for i in indices]
 
-    with ThreadPoolExecutor(max_workers=cfg_workers) as ex:
-        results = list(ex.map(worker, items_list))
+    if len(items_list) < min_batch or cfg_workers <= 1:
+        return system.process_batch_fused(items_list)
+    # Only use as many workers as the estimated work can keep busy
+    costs = [_cost(pair) for pair in items_list]
+    est_cost = sum(costs) + ITEM_BASE_COST * len(items_list)
+    workers = min(cfg_workers, est_cost // cost_per_worker)
+    if workers <= 1:
+        return system.process_batch_fused(items_list)
+    # The pool stays sized to the configuration; only ``workers`` slices are
+    # submitted, balanced longest-processing-time first, so at most that many
+    # threads run this batch. Results go back into the caller's order.
+    slices = _lpt_slices(costs, workers)
+    results: List[Dict[str, Any]] = [None] * len(items_list)  # type: ignore[list-item]
+    for indices, future in zip(slices, _submit_all(cfg_workers, worker, slices)):
+        for i, res in zip(indices, future.result()):
+            results[i] = res
     return results
@@ -1,17 +1,37 @@
 """Forgetting pipeline that orchestrates tier transitions and TTL enforcement."""
 
-from typing import Any, Dict, Iterable, Tuple
+import itertools
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .storage_adapter import StorageAdapter
-from .batch_processor import process_batch
+from .batch_processor import prioritize
 from .system_builder import build_system
+from .work_queue import WorkQueue
 from ..storage.local_fs_adapter import LocalFSAdapter
 from pathlib import Path
 
 
 class ForgettingPipeline:
-    def __init__(self, storage: StorageAdapter = None, use_local_fs: bool = False):
+    RETRY_BASE_DELAY = 0.05
+
+    def __init__(self, storage: StorageAdapter = None, use_local_fs: bool = False, workers: int = 0):
         self.system = build_system()
+        # Failed tier moves are retried off the caller's thread: entries are
+        # (due, seq, item_id, content, tier, ttl, attempt), seq keeps ties orderable
+        self._retry_q: "queue.PriorityQueue[Tuple]" = queue.PriorityQueue()
+        self._retry_seq = itertools.count()
+        self._retry_stop = threading.Event()
+        self._retry_thread: Optional[threading.Thread] = None
+        self._retry_lock = threading.Lock()
+        # With workers > 0, one long-lived WorkQueue serves every run(); otherwise
+        # items are processed sequentially in priority order
+        self.queue: Optional[WorkQueue] = None
+        if workers > 0:
+            self.queue = WorkQueue(self.system, workers=workers)
+            self.queue.start()
         if storage:
             self.storage = storage
         elif use_local_fs:
@@ -21,8 +41,8 @@ class ForgettingPipeline:
             self.storage = StorageAdapter()
 
     def run(self, items: Iterable[Tuple[Any, Dict[str, Any]]]) -> Dict[str, Any]:
-        results = process_batch(self.system, items)
-        for res, (_, meta) in zip(results, items):
+        processed = self._process(items)
+        for meta, res in processed:
             action = res["plan"].action
             item_id = meta.get("id") or res["result"].get("id") if isinstance(res["result"], dict) else None
             content = meta.get("content")
@@ -39,16 +59,87 @@ class ForgettingPipeline:
                 if item_id is not None:
                     self.storage.delete_item(item_id)
         purge_info = self.storage.purge_expired()
-        return {"results": results, "purge": purge_info}
+        return {"results": [res for _, res in processed], "purge": purge_info}
+
+    def _process(self, items: Iterable[Tuple[Any, Dict[str, Any]]]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Process items in priority order; returns (meta, record) pairs in that order.
+
+        ``items`` is consumed exactly once, so generators are fine.
+        """
+        scored = prioritize(self.system, items)
+        if self.queue is None:
+            return [(meta, self.system.process_item(item, meta, scores=scores))
+                    for _, item, meta, scores in scored]
+        slots: List[Optional[Dict[str, Any]]] = [None] * len(scored)
+        for i, (_, item, meta, scores) in enumerate(scored):
+            self.queue.submit(item, meta, callback=lambda res, i=i: slots.__setitem__(i, res), scores=scores)
+        # The queue belongs to this pipeline, so joining it waits for exactly this batch
+        self.queue.join()
+        # Failed items were logged to the ledger by the worker
+        return [(scored[i][2], res) for i, res in enumerate(slots) if res is not None]
+
+    def close(self) -> None:
+        if self.queue is not None:
+            self.queue.stop()
+            self.queue = None
+        self.wait_for_retries()
+        if self._retry_thread is not None:
+            self._retry_stop.set()
+            self._retry_thread.join(timeout=1)
+            self._retry_thread = None
+        try:
+            # Backends with write-back buffering (LocalFSAdapter) persist pending writes
+            close_storage = getattr(self.storage, "close", None)
+            if close_storage is not None:
+                close_storage()
+        finally:
+            # Flushes the ledger's buffered log file
+            self.system.close()
+
+    def wait_for_retries(self) -> None:
+        """Block until every scheduled tier-move retry has succeeded or given up."""
+        if self._retry_thread is not None:
+            self._retry_q.join()
 
     def _move_with_retry(self, item_id, content, tier, ttl=None, retries: int = 2):
-        last_exc = None
-        for attempt in range(retries + 1):
+        try:
+            return self.storage.move_to_tier(item_id, content, tier, ttl=ttl)
+        except Exception as exc:
+            if retries <= 0:
+                return self._move_failed(item_id, tier, exc)
+            self._schedule_retry(item_id, content, tier, ttl, attempt=1, retries=retries)
+            return {"error": str(exc), "retry_scheduled": True}
+
+    def _schedule_retry(self, item_id, content, tier, ttl, attempt: int, retries: int) -> None:
+        due = time.monotonic() + self.RETRY_BASE_DELAY * (2 ** (attempt - 1))
+        with self._retry_lock:
+            if self._retry_thread is None:
+                self._retry_stop.clear()
+                self._retry_thread = threading.Thread(target=self._retry_worker, name="ifs-retry", daemon=True)
+                self._retry_thread.start()
+        self._retry_q.put((due, next(self._retry_seq), item_id, content, tier, ttl, attempt, retries))
+
+    def _retry_worker(self) -> None:
+        while not self._retry_stop.is_set():
             try:
-                return self.storage.move_to_tier(item_id, content, tier, ttl=ttl)
-            except Exception as exc:
-                last_exc = exc
-                time.sleep(0.05 * (2 ** attempt))
-        # log failure
-        self.system.ledger.log_error("storage_move_failed", {"item_id": item_id, "tier": tier, "error": str(last_exc)})
-        return {"error": str(last_exc)}
+                entry = self._retry_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            due, _, item_id, content, tier, ttl, attempt, retries = entry
+            try:
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._retry_stop.wait(delay)
+                try:
+                    self.storage.move_to_tier(item_id, content, tier, ttl=ttl)
+                except Exception as exc:
+                    if attempt < retries:
+                        self._schedule_retry(item_id, content, tier, ttl, attempt + 1, retries)
+                    else:
+                        self._move_failed(item_id, tier, exc)
+            finally:
+                self._retry_q.task_done()
+
+    def _move_failed(self, item_id, tier, exc: Exception) -> Dict[str, Any]:
+        self.system.ledger.log_error("storage_move_failed", {"item_id": item_id, "tier": tier, "error": str(exc)})
+        return {"error": str(exc)}
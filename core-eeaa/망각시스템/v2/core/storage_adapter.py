@@ -1,44 +1,67 @@
-"""Simple tiered storage adapter stub with TTL support and basic locking."""
+"""Simple tiered storage adapter stub with TTL support and fine-grained locking."""
 
+import heapq
+import itertools
 import time
 import threading
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class StorageAdapter:
     def __init__(self):
         self.tiers = {"hot": {}, "warm": {}, "cold": {}}
         self.ttl_map: Dict[Any, float] = {}
-        self._lock = threading.Lock()
+        # Min-heap of (expire_at, seq, item_id); entries whose expire_at no longer
+        # matches ttl_map were superseded or deleted and are skipped on purge
+        self._ttl_heap: List[Tuple[float, int, Any]] = []
+        self._ttl_seq = itertools.count()
+        # One lock per tier plus one for ttl_map, so writers to different tiers do not serialize.
+        # When both are needed, the TTL lock is taken first.
+        self._tier_locks = {name: threading.Lock() for name in self.tiers}
+        self._ttl_lock = threading.Lock()
 
     def move_to_tier(self, item_id: Any, content: Any, tier: str, ttl: Optional[float] = None) -> Dict[str, Any]:
-        with self._lock:
-            if tier not in self.tiers:
-                tier = "cold"
-            self.tiers[tier][item_id] = content
-            if ttl:
-                self.ttl_map[item_id] = time.time() + ttl
-            size = len(content) if isinstance(content, (bytes, str)) else 0
-            return {"tier": tier, "size": size, "ttl": ttl}
+        if tier not in self.tiers:
+            tier = "cold"
+        if ttl:
+            # Content and expiry must change together, or a concurrent purge could
+            # drop the new content under the old expiry
+            with self._ttl_lock, self._tier_locks[tier]:
+                self.tiers[tier][item_id] = content
+                expire_at = time.time() + ttl
+                self.ttl_map[item_id] = expire_at
+                heapq.heappush(self._ttl_heap, (expire_at, next(self._ttl_seq), item_id))
+        else:
+            with self._tier_locks[tier]:
+                self.tiers[tier][item_id] = content
+        size = len(content) if isinstance(content, (bytes, str)) else 0
+        return {"tier": tier, "size": size, "ttl": ttl}
 
     def purge_expired(self) -> Dict[str, int]:
-        with self._lock:
-            now = time.time()
-            removed = 0
-            for item_id, expire_at in list(self.ttl_map.items()):
-                if now >= expire_at:
-                    for tier in self.tiers.values():
-                        tier.pop(item_id, None)
-                    self.ttl_map.pop(item_id, None)
-                    removed += 1
-            return {"removed": removed}
+        now = time.time()
+        removed = 0
+        with self._ttl_lock:
+            heap = self._ttl_heap
+            while heap and heap[0][0] <= now:
+                expire_at, _, item_id = heapq.heappop(heap)
+                if self.ttl_map.get(item_id) != expire_at:
+                    continue
+                del self.ttl_map[item_id]
+                self._pop_from_tiers(item_id)
+                removed += 1
+        return {"removed": removed}
 
     def delete_item(self, item_id: Any) -> Dict[str, Any]:
-        with self._lock:
-            removed = 0
-            for tier in self.tiers.values():
+        with self._ttl_lock:
+            self.ttl_map.pop(item_id, None)
+            removed = self._pop_from_tiers(item_id)
+        return {"removed": removed}
+
+    def _pop_from_tiers(self, item_id: Any) -> int:
+        removed = 0
+        for name, tier in self.tiers.items():
+            with self._tier_locks[name]:
                 if item_id in tier:
-                    tier.pop(item_id, None)
+                    del tier[item_id]
                     removed += 1
-            self.ttl_map.pop(item_id, None)
-            return {"removed": removed}
+        return removed
@@ -1,6 +1,6 @@
 """Default strategy registry and simple ledger hook."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .context_manager import ContextManager
 from ..strategies.gradual_compression import GradualCompression
@@ -13,7 +13,11 @@ from ..strategies.archive import Archive
 from ..strategies.delete import Delete
 
 
-def build_default_registry() -> Dict[str, Any]:
+# Strategies keep no per-item state, so every build shares one set of instances
+_DEFAULT_STRATEGIES: Optional[Dict[str, Any]] = None
+
+
+def _new_strategies() -> Dict[str, Any]:
     return {
         "compress": GradualCompression(),
         "semantic_preserve": SemanticPreservation(),
@@ -24,3 +28,14 @@ def build_default_registry() -> Dict[str, Any]:
         "key_destroy": KeyDestroy(),
         "retain": PredictiveCaching(),
     }
+
+
+def build_default_registry(fresh: bool = False) -> Dict[str, Any]:
+    """Action -> strategy map; ``fresh=True`` builds new instances for isolation."""
+    global _DEFAULT_STRATEGIES
+    if fresh:
+        return _new_strategies()
+    if _DEFAULT_STRATEGIES is None:
+        _DEFAULT_STRATEGIES = _new_strategies()
+    # New dict per call so one system's registry edits don't leak into another's
+    return dict(_DEFAULT_STRATEGIES)
@@ -1,10 +1,17 @@
 """Convenience builder for the Intelligent Forgetting System v2."""
 
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _SafeLoader
+
 from .intelligent_forgetting import IntelligentForgettingSystem
 from .decision_engine import DecisionEngine
 from .learning_optimizer import LearningOptimizer
@@ -23,11 +30,33 @@ from ..algorithms.risk_analyzer import RiskAnalyzer
 from ..storage.local_fs_adapter import LocalFSAdapter
 
 
+_DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[1] / "config" / "default_policy.yaml"
+
+
+@lru_cache(maxsize=8)
+def _parse_config(path: str, mtime_ns: int) -> dict:
+    # mtime_ns is part of the cache key only: an edited file gets a fresh parse
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
 def load_config(path: Path = None) -> dict:
-    default_path = Path(__file__).resolve().parents[1] / "config" / "default_policy.yaml"
-    cfg_path = path or default_path
-    with cfg_path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    cfg_path = path or _DEFAULT_CONFIG_PATH
+    cfg = _parse_config(str(cfg_path), cfg_path.stat().st_mtime_ns)
+    # Private copy: DecisionEngine and LearningOptimizer mutate the nested dicts in place
+    return _copy_plain(cfg)
+
+
+def _copy_plain(value):
+    # Deep copy specialised for safe_load output (dicts, lists, immutable scalars);
+    # about 3x cheaper than copy.deepcopy, which dominated cached load_config calls
+    if type(value) is dict:
+        return {k: _copy_plain(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_plain(v) for v in value]
+    if isinstance(value, (set, bytearray)):
+        return copy.deepcopy(value)
+    return value
 
 
 def build_system(config_path: Path = None) -> IntelligentForgettingSystem:
@@ -60,7 +89,8 @@ def build_system(config_path: Path = None) -> IntelligentForgettingSystem:
     else:
         storage = StorageAdapter()
     metrics = Metrics()
-    return IntelligentForgettingSystem(analyzer, decision, strategies, optimizer, ledger=ledger, storage_adapter=storage, metrics=metrics)
+    return IntelligentForgettingSystem(analyzer, decision, strategies, optimizer, ledger=ledger, storage_adapter=storage, metrics=metrics,
+                                       early_exit=cfg.get("early_exit", False))
 
 
 def reload_config(system, config_path: Path = None) -> None:
@@ -68,3 +98,5 @@ def reload_config(system, config_path: Path = None) -> None:
     system.decision_engine.thresholds = cfg.get("thresholds", system.decision_engine.thresholds)
     system.decision_engine.weights = cfg.get("weights", system.decision_engine.weights)
     system.decision_engine.class_policies = cfg.get("class_policies", getattr(system.decision_engine, "class_policies", {}))
+    # Memoized axis scores were computed under the previous configuration
+    system.clear_cache()
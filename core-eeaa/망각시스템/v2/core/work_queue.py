@@ -2,18 +2,25 @@
 
 import queue
 import threading
-from typing import Any, Dict, Tuple, Callable
+from typing import Any, Dict, Tuple, Callable, Optional
 
 from .intelligent_forgetting import IntelligentForgettingSystem
+from .multidimensional_analyzer import ScoreVector
 
 
 class WorkQueue:
     def __init__(self, system: IntelligentForgettingSystem, workers: int = 4):
         self.system = system
         self.workers = workers
-        self.q: queue.Queue[Tuple[Any, Dict[str, Any], Callable[[Dict[str, Any]], None]]] = queue.Queue()
+        # SimpleQueue has no task_done/join; outstanding tasks are counted here instead
+        self.q: queue.SimpleQueue[Tuple[Any, Dict[str, Any], Callable[[Dict[str, Any]], None], Optional[ScoreVector]]] = (
+            queue.SimpleQueue())
         self._threads = []
         self._stop = threading.Event()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
 
     def start(self):
         for _ in range(self.workers):
@@ -23,24 +30,37 @@ class WorkQueue:
 
     def stop(self):
         self._stop.set()
+        # One sentinel per worker, each blocked in get(), to wake it up
         for _ in self._threads:
             self.q.put(None)  # type: ignore
         for t in self._threads:
             t.join(timeout=1)
+        self._threads = []
+
+    def join(self) -> None:
+        """Block until every submitted task has been processed."""
+        self._idle.wait()
 
-    def submit(self, item: Any, meta: Dict[str, Any], callback: Callable[[Dict[str, Any]], None] = None):
-        self.q.put((item, meta, callback or (lambda _: None)))
+    def submit(self, item: Any, meta: Dict[str, Any], callback: Callable[[Dict[str, Any]], None] = None,
+               scores: Optional[ScoreVector] = None):
+        with self._pending_lock:
+            self._pending += 1
+            self._idle.clear()
+        self.q.put((item, meta, callback or (lambda _: None), scores))
 
     def _worker(self):
         while not self._stop.is_set():
             task = self.q.get()
             if task is None:
                 break
-            item, meta, cb = task
+            item, meta, cb, scores = task
             try:
-                res = self.system.process_item(item, meta)
+                res = self.system.process_item(item, meta, scores=scores)
                 cb(res)
             except Exception as exc:
                 self.system.ledger.log_error("worker_failure", {"error": str(exc), "meta": meta})
             finally:
-                self.q.task_done()
+                with self._pending_lock:
+                    self._pending -= 1
+                    if not self._pending:
+                        self._idle.set()
@@ -1,38 +1,120 @@
 """Local filesystem storage backend (demo only)."""
 
+import atexit
 import time
 import threading
+import weakref
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set, Tuple
 
 from .base import StorageBackend
 
+# Adapters not closed yet; flushed at interpreter exit without keeping them alive
+_OPEN_ADAPTERS: "weakref.WeakSet[LocalFSAdapter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_adapters() -> None:
+    errors = []
+    for adapter in list(_OPEN_ADAPTERS):
+        try:
+            adapter.close()
+        except OSError as exc:
+            errors.append(exc)
+    if errors:
+        raise errors[0]
+
 
 class LocalFSAdapter(StorageBackend):
-    def __init__(self, root: Path):
+    """Tiered files under ``root`` with a write-back buffer.
+
+    ``move_to_tier`` only records the encoded content in memory; files are
+    written when the buffer exceeds ``flush_bytes``, on ``flush()``/``close()``
+    (also registered to run at interpreter exit), and every ``flush_interval``
+    seconds if one is given. Writes that fail stay buffered for the next flush,
+    and the flush raises so callers see the error.
+    """
+
+    def __init__(self, root: Path, flush_bytes: int = 1 << 20, flush_interval: Optional[float] = None):
         self.root = root
         self.root.mkdir(parents=True, exist_ok=True)
         self.ttl_map: Dict[Any, float] = {}
         self._lock = threading.Lock()
+        self._tier_dirs: Set[Path] = set()
+        # Pending writes: newest content per path wins
+        self._wb_buffer: Dict[Path, bytes] = {}
+        self._wb_bytes = 0
+        self._wb_lock = threading.Lock()
+        self._flush_bytes = flush_bytes
+        # Serializes flushes so an older snapshot can never overwrite a newer one
+        self._io_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval:
+            self._flusher = threading.Thread(target=self._flush_loop, args=(flush_interval,), daemon=True)
+            self._flusher.start()
+        _OPEN_ADAPTERS.add(self)
 
     def move_to_tier(self, item_id: Any, content: Any, tier: str, ttl: Optional[float] = None) -> Dict[str, Any]:
         tier_dir = self.root / tier
-        tier_dir.mkdir(parents=True, exist_ok=True)
+        if tier_dir not in self._tier_dirs:
+            tier_dir.mkdir(parents=True, exist_ok=True)
+            self._tier_dirs.add(tier_dir)
         path = tier_dir / f"{item_id}.bin"
-        data = content
-        if isinstance(content, str):
+        if isinstance(content, bytes):
+            data = content
+        elif isinstance(content, str):
             data = content.encode("utf-8")
-        if isinstance(data, bytes):
-            with self._lock:
-                path.write_bytes(data)
         else:
-            with self._lock:
-                path.write_text(str(data), encoding="utf-8")
+            data = str(content).encode("utf-8")
+        with self._wb_lock:
+            previous = self._wb_buffer.get(path)
+            self._wb_buffer[path] = data
+            self._wb_bytes += len(data) - (len(previous) if previous is not None else 0)
+            over = self._wb_bytes >= self._flush_bytes
         if ttl:
             with self._lock:
                 self.ttl_map[item_id] = time.time() + ttl
-        size = path.stat().st_size if path.exists() else 0
-        return {"tier": tier, "size": size, "ttl": ttl, "path": str(path)}
+        if over:
+            # Raises if any buffered write failed, so callers can retry/log the move
+            self.flush()
+        return {"tier": tier, "size": len(data), "ttl": ttl, "path": str(path)}
+
+    def flush(self) -> None:
+        """Write all buffered content to disk.
+
+        Each entry is written independently; failed entries go back into the
+        buffer (unless newer content for the same path arrived meanwhile) and
+        an ``OSError`` naming them is raised once every entry was tried.
+        """
+        with self._io_lock:
+            with self._wb_lock:
+                pending, self._wb_buffer = self._wb_buffer, {}
+                self._wb_bytes = 0
+            failed: Dict[Path, Tuple[bytes, OSError]] = {}
+            for path, data in pending.items():
+                try:
+                    path.write_bytes(data)
+                except OSError as exc:
+                    failed[path] = (data, exc)
+            if not failed:
+                return
+            with self._wb_lock:
+                for path, (data, _) in failed.items():
+                    if path not in self._wb_buffer:
+                        self._wb_buffer[path] = data
+                        self._wb_bytes += len(data)
+        first = next(iter(failed.values()))[1]
+        raise OSError(f"{len(failed)} buffered write(s) failed: "
+                      + ", ".join(str(path) for path in failed)) from first
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        _OPEN_ADAPTERS.discard(self)
+        self.flush()
 
     def purge_expired(self) -> Dict[str, int]:
         with self._lock:
@@ -50,12 +132,26 @@ class LocalFSAdapter(StorageBackend):
             self.ttl_map.pop(item_id, None)
             return {"removed": removed}
 
+    def _flush_loop(self, interval: float) -> None:
+        while not self._closed.wait(interval):
+            try:
+                self.flush()
+            except OSError:
+                # Failed entries stay buffered; the next tick retries them
+                continue
+
     def _delete_files(self, item_id: Any) -> int:
-        count = 0
-        for tier_dir in self.root.iterdir():
-            if tier_dir.is_dir():
-                path = tier_dir / f"{item_id}.bin"
-                if path.exists():
-                    path.unlink()
-                    count += 1
-        return count
+        name = f"{item_id}.bin"
+        # Pending writes for a deleted item are dropped rather than flushed
+        with self._wb_lock:
+            removed = {path for path in self._wb_buffer if path.name == name}
+            for path in removed:
+                self._wb_bytes -= len(self._wb_buffer.pop(path))
+        with self._io_lock:
+            for tier_dir in self.root.iterdir():
+                if tier_dir.is_dir():
+                    path = tier_dir / name
+                    if path.exists():
+                        path.unlink()
+                        removed.add(path)
+        return len(removed)
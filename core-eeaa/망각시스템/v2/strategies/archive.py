@@ -1,6 +1,6 @@
 """Archive strategy stub: move to cold storage with TTL."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 
 class Archive:
@@ -8,6 +8,17 @@ class Archive:
         size = float(meta.get("size_bytes", 1.0))
         saved = size * 0.5  # cold storage reduction
         context.budget_state.record_usage(storage_delta=-saved)
+        return self._result(meta)
+
+    def apply_batch(self, entries: List[Tuple[Any, Dict[str, Any], Any, Any]], context: Any) -> List[Dict[str, Any]]:
+        if not entries:
+            return []
+        saved = sum(float(meta.get("size_bytes", 1.0)) for _, meta, _, _ in entries) * 0.5
+        context.budget_state.record_usage(storage_delta=-saved)
+        return [self._result(meta) for _, meta, _, _ in entries]
+
+    @staticmethod
+    def _result(meta: Dict[str, Any]) -> Dict[str, Any]:
         ttl = meta.get("archive_ttl", 30 * 24 * 3600)
         return {
             "status": "archived",
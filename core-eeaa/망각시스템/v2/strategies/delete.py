@@ -1,6 +1,6 @@
 """Deletion strategy stub."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 
 class Delete:
@@ -9,6 +9,18 @@ class Delete:
         size = float(meta.get("size_bytes", 1.0))
         context.budget_state.record_usage(storage_delta=-size)
         # Placeholder for secure delete; for FS adapter, file removal is in storage layer.
+        return self._result()
+
+    def apply_batch(self, entries: List[Tuple[Any, Dict[str, Any], Any, Any]], context: Any) -> List[Dict[str, Any]]:
+        if not entries:
+            return []
+        context.reversibility_state.advance(7)
+        total = sum(float(meta.get("size_bytes", 1.0)) for _, meta, _, _ in entries)
+        context.budget_state.record_usage(storage_delta=-total)
+        return [self._result() for _ in entries]
+
+    @staticmethod
+    def _result() -> Dict[str, Any]:
         return {
             "status": "deleted",
             "feedback": {"type": "deleted"},
@@ -1,11 +1,23 @@
 """Gradual compression strategy with gzip as a default backend."""
 
-import gzip
-import io
 from typing import Any, Dict
 
+from ..utils.content import extract_content
+
+try:
+    from isal import isal_zlib as _zlib
+except ImportError:  # python-isal not installed: stdlib zlib
+    import zlib as _zlib
+
+# zlib window bits selecting gzip framing, so sizes match a .gz file
+_GZIP_WBITS = 31
+
 
 class GradualCompression:
+    def __init__(self, level: int = 1):
+        # Only the compressed size is used, so favour speed over ratio
+        self.level = level
+
     def apply(self, item: Any, meta: Dict[str, Any], plan: Any, scores: Any, context: Any) -> Dict[str, Any]:
         # Lossless stage first, optionally lossy if requested.
         context.reversibility_state.advance(1)
@@ -13,19 +25,13 @@ class GradualCompression:
         if lossy:
             context.reversibility_state.advance(5)
         # Heuristic compressed size fraction
-        content = meta.get("content") or item.get("content") if isinstance(item, dict) else None
+        content = extract_content(item, meta)
         size = float(meta.get("size_bytes", len(content) if isinstance(content, (str, bytes)) else 1.0))
         compressed_size = size
         if isinstance(content, str):
-            buf = io.BytesIO()
-            with gzip.GzipFile(fileobj=buf, mode="wb") as f:
-                f.write(content.encode("utf-8"))
-            compressed_size = len(buf.getvalue())
-        elif isinstance(content, bytes):
-            buf = io.BytesIO()
-            with gzip.GzipFile(fileobj=buf, mode="wb") as f:
-                f.write(content)
-            compressed_size = len(buf.getvalue())
+            content = content.encode("utf-8")
+        if isinstance(content, bytes):
+            compressed_size = len(_zlib.compress(content, self.level, _GZIP_WBITS))
 
         saved = max(0.0, size - compressed_size)
         if lossy:
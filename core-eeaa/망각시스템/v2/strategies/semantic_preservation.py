@@ -2,16 +2,19 @@
 
 from typing import Any, Dict
 
+from ..utils.content import extract_content
+from ..utils.summarizer import summarize, lsh_signature
+
 
 class SemanticPreservation:
     def apply(self, item: Any, meta: Dict[str, Any], plan: Any, scores: Any, context: Any) -> Dict[str, Any]:
         context.reversibility_state.advance(6)
-        content = meta.get("content") or item.get("content") if isinstance(item, dict) else None
-        from v2.utils.summarizer import summarize, lsh_signature
+        content = extract_content(item, meta)
 
         if isinstance(content, str):
             summary = summarize(content)
-            sig = lsh_signature(summary.split())
+            # Hex at the record boundary: ledger payloads must stay JSON-serializable
+            sig = lsh_signature(summary.split()).hex()
         else:
             summary = meta.get("summary", "placeholder-summary")
             sig = None
@@ -0,0 +1,88 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v2.algorithms.context_analyzer import ContextAnalyzer
+from v2.algorithms.importance_calculator import ImportanceCalculator
+from v2.algorithms.redundancy_analyzer import RedundancyAnalyzer
+from v2.algorithms.semantic_analyzer import SemanticAnalyzer
+from v2.algorithms.temporal_modeler import TemporalModeler
+from v2.algorithms.usage_analyzer import UsageAnalyzer
+from v2.algorithms.risk_analyzer import RiskAnalyzer
+from v2.core.decision_engine import DecisionEngine
+from v2.core.multidimensional_analyzer import MultidimensionalAnalyzer
+
+
+def _build_analyzer(**kwargs):
+    return MultidimensionalAnalyzer(
+        importance_calc=ImportanceCalculator(),
+        usage_analyzer=UsageAnalyzer(),
+        semantic_analyzer=SemanticAnalyzer(),
+        temporal_modeler=TemporalModeler(),
+        context_analyzer=ContextAnalyzer(),
+        redundancy_analyzer=RedundancyAnalyzer(),
+        risk_analyzer=RiskAnalyzer(),
+        **kwargs,
+    )
+
+
+class TestBatchScoring(unittest.TestCase):
+    def test_analyze_batch_matches_analyze(self):
+        analyzer = _build_analyzer()
+        pairs = [
+            ({"id": 1}, {"semantic_value": 0.9, "business_impact": 0.9, "access_frequency": 0.8}),
+            ({"id": 2}, {"content": "junk junk junk data", "redundancy": 1.0, "age_days": 120}),
+            ({"id": 3, "content": "item level content"}, {"urgency_factor": 1.5, "data_recovery_cost": -1}),
+            ({"id": 4}, {}),
+            ({"id": 5}, {"_importance_score": 0.2, "_context_score": 1.7, "business_impact": 1.0}),
+        ]
+        items = [item for item, _ in pairs]
+        metas = [meta for _, meta in pairs]
+        batch = analyzer.analyze_batch(items, metas)
+        self.assertEqual([s.to_dict() for s in batch],
+                         [analyzer.analyze(item, meta).to_dict() for item, meta in pairs])
+
+    def test_memoized_scores_match_uncached(self):
+        cached, uncached = _build_analyzer(), _build_analyzer(memo_size=0)
+        first = [({"id": i}, {"id": i, "content": f"note {i}", "age_days": 10 * i}) for i in range(4)]
+        # Second pass: two repeats, one changed meta, one new item, one item without id
+        second = [first[1], first[2], ({"id": 3}, {"id": 3, "age_days": 99}),
+                  ({"id": 7}, {"id": 7}), ({}, {"access_frequency": 0.4})]
+        for pairs in (first, second):
+            items = [item for item, _ in pairs]
+            metas = [meta for _, meta in pairs]
+            self.assertEqual([s.to_dict() for s in cached.analyze_batch(items, metas)],
+                             [s.to_dict() for s in uncached.analyze_batch(items, metas)])
+        self.assertEqual(cached.analyze(*first[0]), uncached.analyze(*first[0]))
+        cached.clear_cache()
+        self.assertEqual(cached.analyze(*second[2]), uncached.analyze(*second[2]))
+
+    def test_precomputed_scores_short_circuit(self):
+        analyzer = _build_analyzer()
+        meta = {"_importance_score": 0.2, "_context_score": 1.7, "business_impact": 1.0}
+        scores = analyzer.analyze({"id": 1}, meta)
+        self.assertEqual(scores.importance, 0.2)
+        self.assertEqual(scores.context, 1.0)
+        self.assertEqual(ImportanceCalculator().compute({"id": 1}, meta), 0.2)
+        self.assertEqual(ContextAnalyzer().compute_batch([{"id": 1}], [meta]), [1.0])
+
+    def test_fast_path_preserve_matches_full_decision(self):
+        analyzer, engine = _build_analyzer(), DecisionEngine()
+        risky = {"data_recovery_cost": 1.0, "compliance_violation_risk": 1.0,
+                 "business_continuity_impact": 1.0, "reputation_damage": 1.0}
+        fast = analyzer.analyze_fast_path({"id": 1}, risky, engine)
+        self.assertTrue(fast.short_circuit)
+        self.assertTrue(fast.to_dict()["short_circuit"])
+        self.assertNotIn("short_circuit", analyzer.analyze({"id": 1}, risky).to_dict())
+        self.assertEqual(fast.risk, analyzer.analyze({"id": 1}, risky).risk)
+        self.assertEqual(engine.select(fast, risky), engine.select(analyzer.analyze({"id": 1}, risky), risky))
+        self.assertIsNone(analyzer.analyze_fast_path({"id": 1}, {}, engine))
+        self.assertIsNone(analyzer.analyze_fast_path({"id": 1}, dict(risky, allow_processing=True), engine))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,6 +25,19 @@ class TestE2EPipeline(unittest.TestCase):
         res2 = pipe.run([])
         self.assertGreaterEqual(res2["purge"]["removed"], 0)
 
+    def test_generator_input_reaches_storage(self):
+        pipe = ForgettingPipeline()
+        metas = [
+            {"id": "low", "content": "junk", "importance": 0.1, "access_frequency": 0.0,
+             "semantic_value": 0.1, "redundancy": 1.0},
+            {"id": "high", "content": "very important data", "semantic_value": 0.9,
+             "business_impact": 0.9, "access_frequency": 0.8},
+        ]
+        res = pipe.run(({"id": m["id"]}, m) for m in metas)
+        self.assertEqual(len(res["results"]), 2)
+        # Storage actions follow each item's own plan, not the input position
+        self.assertEqual(pipe.storage.tiers["hot"], {"high": "very important data"})
+
     def test_pii_requires_approval(self):
         pipe = ForgettingPipeline()
         items = [({"id": "pii"}, {"id": "pii", "content": "My SSN is 123-45-6789", "class": "pii", "pii": True})]
@@ -1,4 +1,6 @@
+import json
 import sys
+import tempfile
 from pathlib import Path
 import time
 import unittest
@@ -7,7 +9,22 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from v2.core.ledger import Ledger
 from v2.core.pipeline import ForgettingPipeline
+from v2.core.storage_adapter import StorageAdapter
+from v2.storage.local_fs_adapter import LocalFSAdapter
+
+
+class _FlakyStorage(StorageAdapter):
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+
+    def move_to_tier(self, item_id, content, tier, ttl=None):
+        if self.failures > 0:
+            self.failures -= 1
+            raise OSError("transient")
+        return super().move_to_tier(item_id, content, tier, ttl=ttl)
 
 
 class TestLedgerPipeline(unittest.TestCase):
@@ -34,6 +51,81 @@ class TestLedgerPipeline(unittest.TestCase):
         self.assertIn("hash", entry)
         self.assertIn("prev_hash", entry)
 
+    def test_pipeline_with_persistent_work_queue(self):
+        pipe = ForgettingPipeline(workers=2)
+        try:
+            for _ in range(2):  # the same workers serve consecutive runs
+                items = [
+                    ({"id": "hot1"}, {"id": "hot1", "content": "very important", "semantic_value": 0.9,
+                                      "business_impact": 0.9, "access_frequency": 0.8}),
+                    ({"id": "pii1"}, {"id": "pii1", "content": "My SSN is 123-45-6789", "class": "pii", "pii": True}),
+                ]
+                res = pipe.run(items)
+                self.assertEqual(sorted(r["plan"].action for r in res["results"]), ["mask", "preserve"])
+        finally:
+            pipe.close()
+        self.assertIsNone(pipe.queue)
+
+    def test_failed_move_retried_in_background(self):
+        hot = ({"id": "hot1"}, {"id": "hot1", "content": "very important", "semantic_value": 0.9,
+                                "business_impact": 0.9, "access_frequency": 0.8})
+        pipe = ForgettingPipeline(storage=_FlakyStorage(failures=2))
+        res = pipe.run([hot])  # the failed first attempt does not block run()
+        self.assertEqual(len(res["results"]), 1)
+        pipe.wait_for_retries()
+        self.assertEqual(pipe.storage.tiers["hot"], {"hot1": "very important"})
+        pipe.storage.failures = 3  # exhausts retries=2
+        pipe.run([hot])
+        pipe.close()
+        self.assertEqual(pipe.system.ledger.events[-1]["type"], "error")
+        self.assertEqual(pipe.system.ledger.events[-1]["context"]["tier"], "hot")
+
+    def test_local_fs_write_back_buffer(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            fs = LocalFSAdapter(root=Path(tmp))
+            info = fs.move_to_tier("a", "보존", "hot")
+            fs.move_to_tier("b", b"xyz", "cold")
+            path = Path(info["path"])
+            self.assertEqual(info["size"], len("보존".encode("utf-8")))
+            self.assertFalse(path.exists())  # still buffered
+            self.assertEqual(fs.delete_item("b"), {"removed": 1})
+            fs.close()
+            self.assertEqual(path.read_text(encoding="utf-8"), "보존")
+
+    def test_local_fs_failed_writes_stay_buffered(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            fs = LocalFSAdapter(root=Path(tmp))
+            fs.move_to_tier("a", "first", "hot")
+            fs.move_to_tier("b", "second", "hot")
+            blocker = Path(tmp) / "hot" / "a.bin"
+            blocker.mkdir()  # writing a file over a directory fails
+            with self.assertRaises(OSError):
+                fs.flush()
+            self.assertEqual((Path(tmp) / "hot" / "b.bin").read_text(encoding="utf-8"), "second")
+            blocker.rmdir()
+            fs.close()
+            self.assertEqual(blocker.read_text(encoding="utf-8"), "first")
+
+    def test_pipeline_close_flushes_ledger_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            logfile = Path(tmp) / "ledger.jsonl"
+            pipe = ForgettingPipeline()
+            pipe.system.ledger.logfile = logfile
+            pipe.run([({"id": "n1"}, {"id": "n1", "content": "note"})])
+            pipe.close()
+            lines = logfile.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), len(pipe.system.ledger.events))
+
+    def test_ledger_file_matches_in_memory_chain(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            logfile = Path(tmp) / "nested" / "ledger.jsonl"
+            with Ledger(logfile=logfile) as ledger:
+                ledger.log({"type": "decision", "note": "보존"})
+                ledger.log_constraint("pii", passed=False)
+            lines = [json.loads(line) for line in logfile.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(lines, ledger.events)
+        self.assertEqual(lines[1]["prev_hash"], lines[0]["hash"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v2.algorithms.redundancy_analyzer import RedundancyAnalyzer, _BandBloom
+
+
+class TestRedundancyIndex(unittest.TestCase):
+    def test_near_duplicate_scores_higher_and_rescoring_is_stable(self):
+        analyzer = RedundancyAnalyzer()
+        doc = "quarterly revenue report for the northern region including forecasts and risks"
+        first = analyzer.compute({"id": "a"}, {"content": doc})
+        # Re-scoring the same item must not count it as its own duplicate
+        self.assertEqual(analyzer.compute({"id": "a"}, {"content": doc}), first)
+        duplicate = analyzer.compute({"id": "b"}, {"content": doc})
+        self.assertGreater(duplicate, first)
+        unrelated = analyzer.compute({"id": "c"}, {"content": "team offsite lunch menu and travel plans"})
+        self.assertLess(unrelated, duplicate)
+
+    def test_rescoring_after_content_change_is_not_cached(self):
+        analyzer, fresh = RedundancyAnalyzer(), RedundancyAnalyzer()
+        doc = "quarterly revenue report for the northern region including forecasts and risks"
+        other = "team offsite lunch menu and travel plans"
+        for a in (analyzer, fresh):
+            a.compute({"id": 0}, {"content": doc})
+        analyzer.compute({"id": 3}, {"content": other})
+        # id 3 now carries a copy of id 0: scored like a new item with that content
+        self.assertEqual(analyzer.compute({"id": 3}, {"content": doc}), fresh.compute({"id": 9}, {"content": doc}))
+
+    def test_scores_do_not_depend_on_hash_seed(self):
+        script = (
+            "from v2.algorithms.redundancy_analyzer import RedundancyAnalyzer\n"
+            "a = RedundancyAnalyzer()\n"
+            "docs = ['alpha beta gamma delta', 'alpha beta gamma epsilon', 'zeta eta theta', 'alpha beta zeta']\n"
+            "print([a.compute({'id': i}, {'content': d}) for i, d in enumerate(docs)])\n"
+        )
+        outputs = {
+            subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True,
+                           env=dict(os.environ, PYTHONHASHSEED=seed)).stdout
+            for seed in ("1", "2", "3")
+        }
+        self.assertEqual(len(outputs), 1)
+
+    def test_band_bloom_ages_out_old_hashes(self):
+        bloom = _BandBloom(capacity=100, fp_rate=0.01)
+        self.assertFalse(bloom.check_or_add(12345 << 32 | 678))
+        self.assertTrue(bloom.check_or_add(12345 << 32 | 678))
+        fills = [(i * 0x9E3779B97F4A7C15) & ((1 << 64) - 1) for i in range(1, 400)]
+        false_hits = sum(bloom.check_or_add(h) for h in fills)
+        # Two rotations later the first hash is forgotten; fp rate stays near the target
+        self.assertFalse(bloom.check_or_add(12345 << 32 | 678))
+        self.assertLess(false_hits, 20)
+
+    def test_hint_used_without_content(self):
+        analyzer = RedundancyAnalyzer()
+        self.assertEqual(analyzer.compute({"id": 1}, {"redundancy": 0.7}), 0.7)
+
+    def test_meta_content_used_for_non_dict_items(self):
+        meta = {"content": "spam spam spam spam spam spam", "redundancy": 0.0}
+        self.assertGreater(RedundancyAnalyzer().compute("raw payload", meta), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,13 +13,15 @@ from v2.algorithms.semantic_analyzer import SemanticAnalyzer
 from v2.algorithms.temporal_modeler import TemporalModeler
 from v2.algorithms.usage_analyzer import UsageAnalyzer
 from v2.algorithms.risk_analyzer import RiskAnalyzer
+from v2.core.context_manager import BudgetState
 from v2.core.decision_engine import DecisionEngine
 from v2.core.intelligent_forgetting import IntelligentForgettingSystem
 from v2.core.learning_optimizer import LearningOptimizer
 from v2.core.multidimensional_analyzer import MultidimensionalAnalyzer
 from v2.core.strategy_registry import build_default_registry
 from v2.core.batch_processor import process_batch
-from v2.core.parallel_batch import process_batch_parallel
+from v2.core import parallel_batch
+from v2.core.parallel_batch import process_batch_parallel, shutdown_pool
 from v2.core.ledger import Ledger
 from v2.core.system_builder import load_config
 from v2.core.work_queue import WorkQueue
@@ -96,6 +98,42 @@ class TestDecisionFlow(unittest.TestCase):
         actions = [r["plan"].action for r in results]
         self.assertIn(actions[0], {"archive", "delete", "mask"})
 
+    def test_batch_bucketed_dispatch_matches_shared_snapshot(self):
+        items = [
+            ({"id": i}, {"semantic_value": 0.1, "business_impact": 0.0, "access_frequency": 0.0,
+                         "redundancy": 1.0, "size_bytes": 4.0})
+            for i in range(3)
+        ] + [({"id": 9}, {"semantic_value": 0.9, "business_impact": 0.9, "access_frequency": 0.8})]
+        sys = _build_system()
+        results = process_batch(sys, items, bucket_actions=True)
+        self.assertEqual([r["meta"] for r in results][-1], items[-1][1])
+        # Every plan was made against the same pre-batch snapshot
+        self.assertEqual(len({repr(r["context"]) for r in results}), 1)
+        self.assertTrue(all(r["result"].get("status") for r in results))
+        self.assertEqual(len(sys.ledger.events), len(items))
+
+    def test_fused_batch_matches_process_item(self):
+        items = [
+            ({"id": 1}, {"semantic_value": 0.9, "business_impact": 0.9, "access_frequency": 0.8}),
+            ({"id": 2}, {"semantic_value": 0.1, "redundancy": 1.0, "size_bytes": 4.0}),
+            ({"id": 3}, {"class": "pii", "pii": True, "content": "SSN 123-45-6789"}),
+        ]
+        fused, single = _build_system(), _build_system()
+        expected = [single.process_item(item, meta) for item, meta in items]
+        results = fused.process_batch_fused(iter(items))
+        self.assertEqual([r["plan"] for r in results], [r["plan"] for r in expected])
+        self.assertEqual([r["context"] for r in results], [r["context"] for r in expected])
+        self.assertEqual(len(fused.ledger.events), len(items))
+
+    def test_budget_deferred_usage_flushes_once(self):
+        budget = BudgetState()
+        budget.record_usage(storage_delta=5.0)
+        with budget.deferred():
+            budget.record_usage(storage_delta=-1.0)
+            budget.record_usage(storage_delta=-2.0, semantic_delta=0.5)
+            self.assertEqual(budget.utilization, {"storage": 5.0, "semantic": 0.0})
+        self.assertEqual(budget.utilization, {"storage": 2.0, "semantic": 0.5})
+
     def test_pii_class_policy_masks(self):
         sys = _build_system()
         meta = {
@@ -106,6 +144,25 @@ class TestDecisionFlow(unittest.TestCase):
         result = sys.process_item(item={"id": 5}, meta=meta)
         self.assertEqual(result["plan"].action, "mask")
 
+    def test_class_policy_in_place_edits_apply(self):
+        engine = DecisionEngine(class_policies={})
+        scores = _build_system().analyzer.analyze({"id": 1}, {})
+        engine.class_policies["logs"] = {"action": "archive"}
+        self.assertEqual(engine.select(scores, {"class": "logs"}).action, "archive")
+        engine.class_policies["logs"]["action"] = "delete"
+        self.assertEqual(engine.select(scores, {"class": "logs"}).action, "delete")
+
+    def test_shared_plan_params_are_read_only(self):
+        engine = DecisionEngine()
+        engine.thresholds["preserve"], engine.thresholds["compress"] = 2.0, 0.0
+        plan = engine.select(_build_system().analyzer.analyze({"id": 1}, {}), {})
+        self.assertEqual(plan.action, "compress")
+        with self.assertRaises(TypeError):
+            plan.params["lossy"] = True
+        ledger = Ledger()
+        ledger.log({"plan": plan})
+        self.assertEqual(ledger.events[-1]["plan"]["params"], {"lossy": False})
+
     def test_parallel_batch(self):
         sys = _build_system()
         items = [
@@ -113,6 +170,21 @@ class TestDecisionFlow(unittest.TestCase):
         ]
         results = process_batch_parallel(sys, items, max_workers=2)
         self.assertEqual(len(results), len(items))
+        # Force the pool path; the worker pool persists across calls and can be recreated after shutdown
+        sys.decision_engine.thresholds["parallel_min_batch"] = 1
+        sys.decision_engine.thresholds["parallel_cost_per_worker"] = 1
+        sized = [(item, dict(meta, content="x" * (10 * i))) for i, (item, meta) in enumerate(items)]
+        again = process_batch_parallel(sys, sized, max_workers=2)
+        # Heaviest items are dispatched first, but results keep the input order
+        self.assertEqual([r["meta"]["id"] for r in again], [meta["id"] for _, meta in sized])
+        # Fewer workers for a lighter batch limits the slices, not the pool size
+        sys.decision_engine.thresholds["parallel_workers"] = 4
+        sys.decision_engine.thresholds["parallel_cost_per_worker"] = 600
+        self.assertEqual(len(process_batch_parallel(sys, sized)), len(sized))
+        self.assertEqual(parallel_batch._POOL_SIZE, 4)
+        shutdown_pool()
+        self.assertEqual(len(process_batch_parallel(sys, items, max_workers=2)), len(items))
+        shutdown_pool()
 
     def test_reversibility_progress(self):
         sys = _build_system()
@@ -131,7 +203,7 @@ class TestDecisionFlow(unittest.TestCase):
         wq.start()
         results = []
         wq.submit({"id": 20}, {"content": "pii", "class": "pii", "pii": True}, callback=lambda r: results.append(r))
-        wq.q.join()
+        wq.join()
         wq.stop()
         self.assertTrue(results)
 
@@ -0,0 +1,53 @@
+import sys
+import unittest
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from v2.utils import summarizer
+from v2.utils.summarizer import _TOKEN_RE, _tokens, tfidf_score
+
+
+class TestTokens(unittest.TestCase):
+    def test_ascii_fast_path_matches_regex(self):
+        for text in ["Hello, World! foo_bar-baz 42x", "tabs\tand\nnew\x0blines\x00", "", "...",
+                     "Mixed 한국어 text, ok"]:
+            self.assertEqual(_tokens(text), _TOKEN_RE.findall(text.lower()))
+
+
+class TestTfidf(unittest.TestCase):
+    corpus_df = Counter({"alpha": 3, "beta": 1, "gamma": 7, "delta": 2})
+    doc = ["gamma", "alpha", "gamma", "delta", "gamma"]
+
+    @unittest.skipIf(summarizer.np is None, "numpy not installed")
+    def test_vectorized_scores_match_counter_path(self):
+        vocab, df_arr = summarizer.build_vocab(self.corpus_df)
+        ids, scores = summarizer.tfidf_score_ids(self.doc + ["unseen"], vocab, df_arr, 10)
+        terms = list(vocab)
+        expected = tfidf_score(self.doc, self.corpus_df, 10)
+        self.assertEqual({terms[i]: s for i, s in zip(ids.tolist(), scores.tolist())}, dict(expected))
+        # The cached IDF vector follows in-place df updates once invalidated
+        df_arr[vocab["gamma"]] = 1
+        summarizer.invalidate_idf_cache()
+        ids, scores = summarizer.tfidf_score_ids(self.doc, vocab, df_arr, 10)
+        self.assertEqual(scores[ids.tolist().index(vocab["gamma"])],
+                         tfidf_score(self.doc, dict(self.corpus_df, gamma=1), 10)["gamma"])
+
+    @unittest.skipIf(summarizer.tfidf_kernel is None, "numba not installed")
+    def test_numba_kernel_matches_numpy(self):
+        vocab, df_arr = summarizer.build_vocab(self.corpus_df)
+        try:
+            jit_ids, jit_scores = summarizer.tfidf_score_ids(self.doc, vocab, df_arr, 10)
+            summarizer.activate_numba_scorer(False)
+            np_ids, np_scores = summarizer.tfidf_score_ids(self.doc, vocab, df_arr, 10)
+        finally:
+            summarizer.activate_numba_scorer()
+        self.assertEqual(jit_ids.tolist(), np_ids.tolist())
+        self.assertEqual(jit_scores.tolist(), np_scores.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+"""Optional Numba kernel for TF-IDF scoring over term ids.
+
+Importing this module requires numpy and numba; ``summarizer.tfidf_score_ids``
+falls back to its NumPy expression when they are not installed.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def tfidf_kernel(ids, idf, tf):
+    """Count ``ids`` into the zeroed ``tf`` buffer and score the present terms.
+
+    Returns ``(present, scores)`` in id order. No fastmath, so scores match
+    the NumPy path exactly.
+    """
+    for i in range(ids.shape[0]):
+        tf[ids[i]] += 1
+    present = np.nonzero(tf)[0]
+    scores = np.empty(present.shape[0], dtype=np.float64)
+    for j in range(present.shape[0]):
+        t = present[j]
+        scores[j] = tf[t] * idf[t]
+    return present, scores
+
+
+# Compile (or load from cache) at import so the first document does not pay for it
+tfidf_kernel(np.zeros(1, dtype=np.intp), np.ones(1, dtype=np.float64), np.zeros(1, dtype=np.int64))
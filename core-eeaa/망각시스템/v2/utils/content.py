@@ -0,0 +1,13 @@
+"""Content lookup shared by strategies and batch helpers."""
+
+from typing import Any, Dict, Optional, Union
+
+
+def extract_content(item: Any, meta: Dict[str, Any]) -> Optional[Union[str, bytes]]:
+    """Item content: ``meta["content"]`` if truthy, else ``item["content"]`` for dict items."""
+    content = meta.get("content")
+    if content:
+        return content
+    if isinstance(item, dict):
+        return item.get("content")
+    return content